@@ -1,13 +1,17 @@
+from pathlib import Path
+
 from playwright.sync_api import sync_playwright
 
+from src.file_io import atomic_write_json
+
 
 # Uso:
-#   python scripts/save_studio_storage_state.py storage_state.json
+#   python -m scripts.save_studio_storage_state storage_state.json
 # Luego abre Chromium, inicia sesión manualmente en YouTube Studio y pulsa Enter.
 def main() -> None:
     import sys
 
-    output = sys.argv[1] if len(sys.argv) > 1 else "storage_state.json"
+    output = Path(sys.argv[1] if len(sys.argv) > 1 else "storage_state.json")
 
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=False)
@@ -15,7 +19,7 @@ def main() -> None:
         page = context.new_page()
         page.goto("https://studio.youtube.com")
         input("Inicia sesión en YouTube Studio y pulsa Enter para guardar sesión... ")
-        context.storage_state(path=output)
+        atomic_write_json(output, context.storage_state())
         browser.close()
         print(f"Storage state guardado en: {output}")
 
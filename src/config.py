@@ -30,6 +30,7 @@ class Config:
     studio_slow_mo_ms: int = 0
     studio_log_screenshots: bool = True
     studio_log_screenshots_dir: str = "studio_logs"
+    studio_screenshot_full_page: bool = False
 
 
 def _require_env(name: str) -> str:
@@ -111,4 +112,5 @@ def load_config() -> Config:
         studio_slow_mo_ms=_get_int_env("YT_STUDIO_SLOW_MO_MS", 0),
         studio_log_screenshots=_get_bool_env("YT_STUDIO_LOG_SCREENSHOTS", True),
         studio_log_screenshots_dir=_get_str_env("YT_STUDIO_LOG_SCREENSHOTS_DIR", "studio_logs"),
+        studio_screenshot_full_page=_get_bool_env("YT_STUDIO_SCREENSHOT_FULL", False),
     )
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from io import BytesIO
 import json
 import random
@@ -33,6 +35,37 @@ class BroadcastTemplate:
     source_title: str
 
 
+@dataclass(frozen=True, slots=True)
+class BroadcastItem:
+    id: str
+    title: str
+    description: str
+    scheduled_start_raw: Optional[str]
+    actual_end_raw: Optional[str]
+    content_details: dict[str, Any]
+    privacy_status: str
+    snippet: dict[str, Any]
+    status: dict[str, Any]
+    monetization_details: dict[str, Any]
+
+    @classmethod
+    def from_api(cls, item: dict[str, Any]) -> "BroadcastItem":
+        snippet = item.get("snippet") or {}
+        status = item.get("status") or {}
+        return cls(
+            id=item.get("id", ""),
+            title=snippet.get("title", ""),
+            description=snippet.get("description", ""),
+            scheduled_start_raw=snippet.get("scheduledStartTime"),
+            actual_end_raw=snippet.get("actualEndTime"),
+            content_details=item.get("contentDetails") or {},
+            privacy_status=status.get("privacyStatus", "unlisted"),
+            snippet=snippet,
+            status=status,
+            monetization_details=item.get("monetizationDetails") or {},
+        )
+
+
 @dataclass(frozen=True)
 class BroadcastDefinition:
     prefix: str
@@ -61,6 +94,7 @@ DEFAULT_MONETIZATION_DETAILS = {
 FORCED_CONTENT_DETAILS_DEFAULTS = {
     "enableLiveChat": False,
 }
+THUMBNAIL_PREFETCH_WORKERS = 4
 
 
 class StopCreationLimit(Exception):
@@ -89,56 +123,65 @@ def _rfc3339(dt: datetime) -> str:
     return dt.isoformat()
 
 
-def _iter_broadcasts(youtube, page_size: int = 50) -> Iterable[dict[str, Any]]:
-    page_token = None
-    while True:
-        request = youtube.liveBroadcasts().list(
-            part="id,snippet,contentDetails,status,monetizationDetails",
-            mine=True,
-            maxResults=page_size,
-            pageToken=page_token,
-            broadcastType="all",
-        )
-        response = _execute_with_transient_retry(
+def _iter_broadcast_pages(youtube, **list_kwargs) -> Iterable[BroadcastItem]:
+    def fetch_page(page_token: Optional[str]) -> dict[str, Any]:
+        request = youtube.liveBroadcasts().list(pageToken=page_token, **list_kwargs)
+        return _execute_with_transient_retry(
             operation_name="liveBroadcasts.list",
             operation=request.execute,
         )
-        for item in response.get("items", []):
-            yield item
-        page_token = response.get("nextPageToken")
-        if not page_token:
-            break
+
+    # La página siguiente se pide en segundo plano mientras se consumen los items de la
+    # actual. Solo hay una petición en vuelo a la vez, y sus errores se propagan al llegar
+    # a esa página, en orden.
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        response = fetch_page(None)
+        while True:
+            page_token = response.get("nextPageToken")
+            next_page = prefetcher.submit(fetch_page, page_token) if page_token else None
+            for item in response.get("items", []):
+                yield BroadcastItem.from_api(item)
+            if next_page is None:
+                break
+            response = next_page.result()
+
+
+def _iter_broadcasts(youtube, page_size: int = 50) -> Iterable[BroadcastItem]:
+    return _iter_broadcast_pages(
+        youtube,
+        part="id,snippet,contentDetails,status,monetizationDetails",
+        mine=True,
+        maxResults=page_size,
+        broadcastType="all",
+    )
 
 
 def find_broadcast_by_title_in_items(
-    items: Iterable[dict[str, Any]], title: str
-) -> Optional[dict[str, Any]]:
+    items: Iterable[BroadcastItem], title: str
+) -> Optional[BroadcastItem]:
     normalized_title = " ".join(title.split()).casefold()
     for item in items:
-        candidate = item.get("snippet", {}).get("title", "")
-        if " ".join(candidate.split()).casefold() == normalized_title:
+        if " ".join(item.title.split()).casefold() == normalized_title:
             return item
     return None
 
 
 def find_scheduled_broadcast_for_slot_in_items(
-    items: Iterable[dict[str, Any]],
+    items: Iterable[BroadcastItem],
     *,
     title: str,
     keyword: str,
     scheduled_start: datetime,
     tz: ZoneInfo,
-) -> Optional[dict[str, Any]]:
+) -> Optional[BroadcastItem]:
     by_title = find_broadcast_by_title_in_items(items, title)
     if by_title:
         return by_title
 
     for item in items:
-        snippet = item.get("snippet", {})
-        candidate_title = snippet.get("title", "")
-        if keyword not in candidate_title:
+        if keyword not in item.title:
             continue
-        if snippet.get("actualEndTime"):
+        if item.actual_end_raw:
             continue
         candidate_start = _parse_scheduled_start(item, tz)
         if not candidate_start:
@@ -148,8 +191,8 @@ def find_scheduled_broadcast_for_slot_in_items(
     return None
 
 
-def _parse_scheduled_start(item: dict[str, Any], tz: ZoneInfo) -> Optional[datetime]:
-    scheduled_start = item.get("snippet", {}).get("scheduledStartTime")
+def _parse_scheduled_start(item: BroadcastItem, tz: ZoneInfo) -> Optional[datetime]:
+    scheduled_start = item.scheduled_start_raw
     if not scheduled_start:
         return None
     try:
@@ -162,13 +205,12 @@ def _parse_scheduled_start(item: dict[str, Any], tz: ZoneInfo) -> Optional[datet
 
 
 def find_latest_scheduled_broadcast_in_items(
-    items: Iterable[dict[str, Any]], keywords: Iterable[str], tz: ZoneInfo
+    items: Iterable[BroadcastItem], keywords: Iterable[str], tz: ZoneInfo
 ) -> Optional[datetime]:
     latest: Optional[datetime] = None
     keyword_list = tuple(keywords)
     for item in items:
-        title = item.get("snippet", {}).get("title", "")
-        if not any(keyword in title for keyword in keyword_list):
+        if not any(keyword in item.title for keyword in keyword_list):
             continue
         scheduled_start = _parse_scheduled_start(item, tz)
         if not scheduled_start:
@@ -218,37 +260,36 @@ def _parse_item_datetime(value: Optional[str]) -> Optional[datetime]:
     return parsed
 
 
-def _build_template_from_item(item: dict[str, Any], *, from_emitted: bool) -> BroadcastTemplate:
-    content_details = item.get("contentDetails", {})
-    status = item.get("status", {})
-    snippet = item.get("snippet", {})
+def _build_template_from_item(item: BroadcastItem, *, from_emitted: bool) -> BroadcastTemplate:
+    content_details = item.content_details
+    snippet = item.snippet
     return BroadcastTemplate(
         content_details=content_details,
-        privacy_status=status.get("privacyStatus", "unlisted"),
-        status_defaults=_pick_status_defaults(status),
+        privacy_status=item.privacy_status,
+        status_defaults=_pick_status_defaults(item.status),
         bound_stream_id=content_details.get("boundStreamId"),
-        description=snippet.get("description", ""),
+        description=item.description,
         snippet_defaults=_pick_snippet_defaults(snippet),
-        monetization_details=_pick_monetization_defaults(item.get("monetizationDetails", {})),
+        monetization_details=_pick_monetization_defaults(item.monetization_details),
         thumbnail_url=_pick_thumbnail_url(snippet),
         from_emitted=from_emitted,
-        source_id=item.get("id", "(sin id)"),
+        source_id=item.id or "(sin id)",
         source_title=snippet.get("title", "(sin título)"),
     )
 
 
 def find_template_by_keyword_in_items(
-    items: Iterable[dict[str, Any]], keyword: str
+    items: Iterable[BroadcastItem], keyword: str
 ) -> Optional[BroadcastTemplate]:
-    candidates = [item for item in items if keyword in item.get("snippet", {}).get("title", "")]
+    candidates = [item for item in items if keyword in item.title]
     if not candidates:
         return None
 
-    emitted = [item for item in candidates if item.get("snippet", {}).get("actualEndTime")]
+    emitted = [item for item in candidates if item.actual_end_raw]
     if emitted:
         latest_emitted = max(
             emitted,
-            key=lambda item: _parse_item_datetime(item.get("snippet", {}).get("actualEndTime"))
+            key=lambda item: _parse_item_datetime(item.actual_end_raw)
             or datetime.min.replace(tzinfo=ZoneInfo("UTC")),
         )
         return _build_template_from_item(latest_emitted, from_emitted=True)
@@ -256,27 +297,27 @@ def find_template_by_keyword_in_items(
     scheduled_with_metadata = [
         item
         for item in candidates
-        if item.get("snippet", {}).get("description")
-        or item.get("contentDetails", {}).get("boundStreamId")
-        or item.get("snippet", {}).get("thumbnails")
+        if item.description
+        or item.content_details.get("boundStreamId")
+        or item.snippet.get("thumbnails")
     ]
     if scheduled_with_metadata:
         latest_scheduled = max(
             scheduled_with_metadata,
-            key=lambda item: _parse_item_datetime(item.get("snippet", {}).get("scheduledStartTime"))
+            key=lambda item: _parse_item_datetime(item.scheduled_start_raw)
             or datetime.min.replace(tzinfo=ZoneInfo("UTC")),
         )
         return _build_template_from_item(latest_scheduled, from_emitted=False)
 
     latest_any = max(
         candidates,
-        key=lambda item: _parse_item_datetime(item.get("snippet", {}).get("scheduledStartTime"))
+        key=lambda item: _parse_item_datetime(item.scheduled_start_raw)
         or datetime.min.replace(tzinfo=ZoneInfo("UTC")),
     )
     return _build_template_from_item(latest_any, from_emitted=False)
 
 
-def find_broadcast_by_title(youtube, title: str) -> Optional[dict[str, Any]]:
+def find_broadcast_by_title(youtube, title: str) -> Optional[BroadcastItem]:
     return find_broadcast_by_title_in_items(_iter_broadcasts(youtube), title)
 
 
@@ -288,6 +329,7 @@ def find_latest_scheduled_broadcast(
     )
 
 
+
 def find_template_by_keyword(youtube, keyword: str) -> Optional[BroadcastTemplate]:
     return find_template_by_keyword_in_items(_iter_broadcasts(youtube), keyword)
 
@@ -353,6 +395,18 @@ def _build_monetization_details(template: Optional[BroadcastTemplate]) -> dict[s
 
 
 def _parse_error_reason(error: HttpError) -> tuple[str | None, str | None]:
+    cached = getattr(error, "_parsed_reason", None)
+    if cached is not None:
+        return cached
+    parsed = _decode_error_reason(error)
+    try:
+        error._parsed_reason = parsed
+    except AttributeError:
+        pass
+    return parsed
+
+
+def _decode_error_reason(error: HttpError) -> tuple[str | None, str | None]:
     try:
         payload = json.loads(error.content.decode("utf-8"))
     except (json.JSONDecodeError, AttributeError):
@@ -401,6 +455,11 @@ def _is_transient_http_error(error: HttpError) -> tuple[bool, str | None]:
     return False, message
 
 
+@lru_cache(maxsize=None)
+def _backoff_delays(retry_limit: int, base_seconds: float, max_seconds: float) -> tuple[float, ...]:
+    return tuple(min(max_seconds, base_seconds * (2**attempt)) for attempt in range(retry_limit + 1))
+
+
 def _execute_with_transient_retry(
     operation_name: str,
     operation,
@@ -408,6 +467,7 @@ def _execute_with_transient_retry(
     base_seconds: float = 1.0,
     max_seconds: float = 8.0,
 ):
+    delays = _backoff_delays(retry_limit, base_seconds, max_seconds)
     for attempt in range(retry_limit + 1):
         try:
             return operation()
@@ -415,7 +475,7 @@ def _execute_with_transient_retry(
             is_transient, detail = _is_transient_http_error(error)
             if not is_transient or attempt >= retry_limit:
                 raise
-            wait_seconds = min(max_seconds, base_seconds * (2**attempt)) + random.uniform(0, 0.5)
+            wait_seconds = delays[attempt] + random.uniform(0, 0.5)
             _log(
                 f"WARN: error transitorio en {operation_name} "
                 f"({detail or 'sin detalle'}) intento {attempt + 1}/{retry_limit + 1}. "
@@ -514,6 +574,7 @@ def _with_rate_limit_retry(
     max_seconds: float,
     operation,
 ):
+    delays = _backoff_delays(retry_limit, base_seconds, max_seconds)
     for attempt in range(retry_limit + 1):
         try:
             return operation()
@@ -526,7 +587,7 @@ def _with_rate_limit_retry(
                     f"rate limit en {operation_name}",
                     details=detail or "userRequestsExceedRateLimit",
                 )
-            wait_seconds = min(max_seconds, base_seconds * (2**attempt)) + random.uniform(0, 0.5)
+            wait_seconds = delays[attempt] + random.uniform(0, 0.5)
             _log(
                 f"WARN: rate limit en {operation_name} para '{title}' "
                 f"(intento {attempt + 1}/{retry_limit + 1}), reintentando en {wait_seconds:.2f}s."
@@ -562,20 +623,30 @@ def _create_broadcast_with_retry(
     )
 
 
-def _ensure_template_for_keyword(
-    broadcasts: list[dict[str, Any]],
-    keyword: str,
-) -> Optional[BroadcastTemplate]:
-    template = find_template_by_keyword_in_items(broadcasts, keyword)
-    _log_template_copy_plan(keyword, template)
-    return template
+class TemplateFinder:
+    def __init__(self, broadcasts: list[BroadcastItem]) -> None:
+        self._broadcasts = broadcasts
+        self._cache: dict[str, Optional[BroadcastTemplate]] = {}
+
+    @property
+    def templates(self) -> dict[str, Optional[BroadcastTemplate]]:
+        return self._cache
+
+    def get(self, keyword: str) -> Optional[BroadcastTemplate]:
+        if keyword in self._cache:
+            return self._cache[keyword]
+        template = find_template_by_keyword_in_items(self._broadcasts, keyword)
+        _log_template_copy_plan(keyword, template)
+        if template:
+            _log(f"TEMPLATE: '{keyword}' encontrada.")
+        self._cache[keyword] = template
+        return template
 
 
-def _list_scheduled_broadcasts(items: Iterable[dict[str, Any]], tz: ZoneInfo) -> list[str]:
+def _list_scheduled_broadcasts(items: Iterable[BroadcastItem], tz: ZoneInfo) -> list[str]:
     scheduled_rows: list[tuple[datetime, str, str]] = []
     for item in items:
-        snippet = item.get("snippet", {})
-        if snippet.get("actualEndTime"):
+        if item.actual_end_raw:
             continue
         scheduled_start = _parse_scheduled_start(item, tz)
         if not scheduled_start:
@@ -583,8 +654,8 @@ def _list_scheduled_broadcasts(items: Iterable[dict[str, Any]], tz: ZoneInfo) ->
         scheduled_rows.append(
             (
                 scheduled_start,
-                snippet.get("title", "(sin título)"),
-                item.get("id", "(sin id)"),
+                item.title or "(sin título)",
+                item.id or "(sin id)",
             )
         )
     scheduled_rows.sort(key=lambda row: row[0])
@@ -624,27 +695,48 @@ def _bind_stream_with_retry(
     )
 
 
-def _find_latest_emitted_stream_id(items: Iterable[dict[str, Any]]) -> Optional[str]:
+def _find_latest_emitted_stream_id(items: Iterable[BroadcastItem]) -> Optional[str]:
     emitted_with_stream = [
         item
         for item in items
-        if item.get("snippet", {}).get("actualEndTime")
-        and item.get("contentDetails", {}).get("boundStreamId")
+        if item.actual_end_raw and item.content_details.get("boundStreamId")
     ]
     if not emitted_with_stream:
         return None
     latest = max(
         emitted_with_stream,
-        key=lambda item: _parse_item_datetime(item.get("snippet", {}).get("actualEndTime"))
+        key=lambda item: _parse_item_datetime(item.actual_end_raw)
         or datetime.min.replace(tzinfo=ZoneInfo("UTC")),
     )
-    return latest.get("contentDetails", {}).get("boundStreamId")
+    return latest.content_details.get("boundStreamId")
 
 
-def _set_thumbnail_from_url(youtube, video_id: str, thumbnail_url: str) -> None:
+def _download_thumbnail(thumbnail_url: str) -> tuple[bytes, Optional[str]]:
     with urlopen(thumbnail_url) as response:
         content_type = response.headers.get_content_type()
         data = response.read()
+    return data, content_type
+
+
+def _prefetch_thumbnail(
+    pool: ThreadPoolExecutor,
+    downloads: dict[str, Future],
+    template: Optional[BroadcastTemplate],
+) -> None:
+    if template and template.thumbnail_url and template.thumbnail_url not in downloads:
+        downloads[template.thumbnail_url] = pool.submit(_download_thumbnail, template.thumbnail_url)
+
+
+def _set_thumbnail_from_url(
+    youtube,
+    video_id: str,
+    thumbnail_url: str,
+    prefetched: Optional[Future] = None,
+) -> None:
+    if prefetched is not None:
+        data, content_type = prefetched.result()
+    else:
+        data, content_type = _download_thumbnail(thumbnail_url)
     media = MediaIoBaseUpload(
         BytesIO(data),
         mimetype=content_type or "image/jpeg",
@@ -658,6 +750,7 @@ def _ensure_thumbnail(
     broadcast_id: str,
     template: Optional[BroadcastTemplate],
     title: str,
+    thumbnail_downloads: Optional[dict[str, Future]] = None,
 ) -> bool:
     if not hasattr(youtube, "thumbnails"):
         _log(f"WARN: API thumbnails no disponible para '{title}', no se puede validar miniatura.")
@@ -665,8 +758,23 @@ def _ensure_thumbnail(
     if not template or not template.thumbnail_url:
         _log(f"ERROR: '{title}' sin miniatura de plantilla para replicar.")
         return False
+    prefetched = (thumbnail_downloads or {}).get(template.thumbnail_url)
+    if prefetched is not None and prefetched.exception() is not None:
+        # Un fallo puntual de la descarga anticipada no debe tumbar todas las emisiones de la
+        # plantilla: se olvida y cada emisión vuelve a descargar la miniatura por su cuenta.
+        _log(
+            f"WARN: descarga anticipada de {template.thumbnail_url} fallida "
+            f"({prefetched.exception()}); se reintenta directamente."
+        )
+        del thumbnail_downloads[template.thumbnail_url]
+        prefetched = None
     try:
-        _set_thumbnail_from_url(youtube, broadcast_id, template.thumbnail_url)
+        _set_thumbnail_from_url(
+            youtube,
+            broadcast_id,
+            template.thumbnail_url,
+            prefetched=prefetched,
+        )
         _log(f"THUMBNAIL: broadcast {broadcast_id} <- {template.thumbnail_url}")
         return True
     except Exception as error:
@@ -691,10 +799,15 @@ def _log_template_copy_plan(keyword: str, template: Optional[BroadcastTemplate])
     )
 
 
+def _format_status_list(title: str, items: list[str]) -> str:
+    header = f"STATUS: {title} ({len(items)})"
+    if not items:
+        return header
+    return header + "\n" + "\n".join(f"  - {item}" for item in items)
+
+
 def _log_status_list(title: str, items: list[str]) -> None:
-    _log(f"STATUS: {title} ({len(items)})")
-    for item in items:
-        _log(f"  - {item}")
+    _log(_format_status_list(title, items))
 
 
 def _log_summary(
@@ -703,10 +816,16 @@ def _log_summary(
     existing: list[str],
     failed: list[str],
 ) -> None:
-    _log_status_list("planificadas para crear", planned)
-    _log_status_list("creadas", created)
-    _log_status_list("ya existían", existing)
-    _log_status_list("fallidas", failed)
+    _log(
+        "\n".join(
+            (
+                _format_status_list("planificadas para crear", planned),
+                _format_status_list("creadas", created),
+                _format_status_list("ya existían", existing),
+                _format_status_list("fallidas", failed),
+            )
+        )
+    )
 
 
 def run_scheduler(youtube, config: Config) -> int:
@@ -723,8 +842,9 @@ def run_scheduler(youtube, config: Config) -> int:
         BroadcastDefinition(config.keyword_misa_20, time(20, 0), config.keyword_misa_20, DEFAULT_MISA_DESCRIPTION),
         BroadcastDefinition(config.keyword_vela_21, time(21, 0), config.keyword_vela_21, DEFAULT_VELA_DESCRIPTION),
     ]
+    # La vela de las 21h solo se programa los jueves.
+    non_thursday_definitions = [d for d in definitions if d.keyword != config.keyword_vela_21]
     start_date = today + timedelta(days=config.start_offset_days)
-    broadcasts = list(_iter_broadcasts(youtube))
     _log(f"START: procesando desde {start_date.isoformat()} (sin saltar huecos).")
     max_days_ahead = min(config.max_days_ahead, 11)
     end_date = today + timedelta(days=max_days_ahead)
@@ -734,18 +854,14 @@ def run_scheduler(youtube, config: Config) -> int:
             f"{start_date.isoformat()} > fin {end_date.isoformat()})."
         )
         return 0
+    broadcasts = list(_iter_broadcasts(youtube))
     total_days = (end_date - start_date).days + 1
     _log_status_list("emisiones programadas detectadas", _list_scheduled_broadcasts(broadcasts, tz))
 
-    templates: dict[str, Optional[BroadcastTemplate]] = {}
+    template_finder = TemplateFinder(broadcasts)
     for definition in definitions:
-        if definition.keyword not in templates:
-            templates[definition.keyword] = _ensure_template_for_keyword(
-                broadcasts,
-                definition.keyword,
-            )
-            if templates[definition.keyword]:
-                _log(f"TEMPLATE: '{definition.keyword}' encontrada.")
+        template_finder.get(definition.keyword)
+    templates = template_finder.templates
 
     shared_stream_id = _find_latest_emitted_stream_id(broadcasts)
     if not shared_stream_id:
@@ -756,94 +872,99 @@ def run_scheduler(youtube, config: Config) -> int:
     existing_titles: list[str] = []
     failed: list[str] = []
 
-    for offset in range(total_days):
-        target_date = start_date + timedelta(days=offset)
-        _log(f"DAY: procesando {target_date.isoformat()}")
-        for definition in definitions:
-            if (
-                definition.keyword == config.keyword_vela_21
-                and target_date.weekday() != 3
-            ):
-                continue
-            scheduled_start = datetime.combine(target_date, definition.scheduled_time, tz)
-            title = build_title(definition.prefix, target_date)
-            existing = find_scheduled_broadcast_for_slot_in_items(
-                broadcasts,
-                title=title,
-                keyword=definition.keyword,
-                scheduled_start=scheduled_start,
-                tz=tz,
-            )
-            if existing:
-                _log(f"SKIP: ya existe '{title}' (id={existing.get('id')})")
-                existing_titles.append(title)
-                continue
-            planned.append(title)
-            template = templates.get(definition.keyword)
-            description = template.description if template and template.description else definition.default_description
-            try:
-                created = _create_broadcast_with_retry(
-                    youtube,
+    # Cada miniatura de plantilla se descarga en segundo plano la primera vez que una emisión
+    # la necesita, mientras se crea esa emisión; si no se crea nada, no se descarga nada.
+    with ThreadPoolExecutor(max_workers=THUMBNAIL_PREFETCH_WORKERS) as thumbnail_pool:
+        thumbnail_downloads: dict[str, Future] = {}
+
+        for offset in range(total_days):
+            target_date = start_date + timedelta(days=offset)
+            _log(f"DAY: procesando {target_date.isoformat()}")
+            day_definitions = definitions if target_date.weekday() == 3 else non_thursday_definitions
+            for definition in day_definitions:
+                scheduled_start = datetime.combine(target_date, definition.scheduled_time, tz)
+                title = build_title(definition.prefix, target_date)
+                existing = find_scheduled_broadcast_for_slot_in_items(
+                    broadcasts,
                     title=title,
-                    description=description,
+                    keyword=definition.keyword,
                     scheduled_start=scheduled_start,
-                    template=template,
-                    default_privacy_status=config.default_privacy_status,
-                    retry_limit=config.rate_limit_retry_limit,
-                    base_seconds=config.rate_limit_retry_base_seconds,
-                    max_seconds=config.rate_limit_retry_max_seconds,
-                )
-                created = _ensure_chat_disabled(youtube, created)
-                created_settings = _format_creation_settings(
-                    {
-                        "contentDetails": created.get("contentDetails", _build_content_details(template)),
-                        "monetizationDetails": _build_monetization_details(template),
-                    }
+                    tz=tz,
                 )
-                _log(f"CREATED: '{title}' (id={created.get('id')}) | {created_settings}")
-                created_titles.append(title)
-                created_id = created.get("id")
-                if created_id and not _ensure_thumbnail(youtube, created_id, template, title):
-                    _delete_broadcast(youtube, created_id)
-                    failed.append(f"{title} (miniatura no replicada)")
-                    created_titles.pop()
+                if existing:
+                    _log(f"SKIP: ya existe '{title}' (id={existing.id})")
+                    existing_titles.append(title)
                     continue
-                broadcasts.append(created)
-                stream_id = shared_stream_id
-                if stream_id:
-                    _bind_stream_with_retry(
+                planned.append(title)
+                template = templates.get(definition.keyword)
+                if hasattr(youtube, "thumbnails"):
+                    _prefetch_thumbnail(thumbnail_pool, thumbnail_downloads, template)
+                description = template.description if template and template.description else definition.default_description
+                try:
+                    created = _create_broadcast_with_retry(
                         youtube,
-                        created.get("id"),
-                        stream_id,
-                        title,
-                        config.rate_limit_retry_limit,
-                        config.rate_limit_retry_base_seconds,
-                        config.rate_limit_retry_max_seconds,
+                        title=title,
+                        description=description,
+                        scheduled_start=scheduled_start,
+                        template=template,
+                        default_privacy_status=config.default_privacy_status,
+                        retry_limit=config.rate_limit_retry_limit,
+                        base_seconds=config.rate_limit_retry_base_seconds,
+                        max_seconds=config.rate_limit_retry_max_seconds,
                     )
-                    _log(f"BIND: broadcast {created.get('id')} -> stream {stream_id}")
-                sleep(config.create_pause_seconds)
-            except StopCreationLimit as limit_error:
-                if config.stop_on_create_limit:
-                    detail_text = limit_error.details or "rateLimitExceeded"
-                    _log(f"STOP: límite alcanzado ({detail_text})")
-                    _log_summary(planned, created_titles, existing_titles, failed)
-                    return 0
-                failed.append(f"{title} (rate limit: {limit_error.details or 'sin detalle'})")
-            except HttpError as error:
-                is_limit, detail = _is_quota_or_limit_error(error)
-                if is_limit and config.stop_on_create_limit:
-                    detail_text = detail or "API limit"
-                    _log(f"STOP: límite alcanzado ({detail_text})")
+                    created = _ensure_chat_disabled(youtube, created)
+                    created_settings = _format_creation_settings(
+                        {
+                            "contentDetails": created.get("contentDetails", _build_content_details(template)),
+                            "monetizationDetails": _build_monetization_details(template),
+                        }
+                    )
+                    _log(f"CREATED: '{title}' (id={created.get('id')}) | {created_settings}")
+                    created_titles.append(title)
+                    created_id = created.get("id")
+                    if created_id and not _ensure_thumbnail(
+                        youtube, created_id, template, title, thumbnail_downloads
+                    ):
+                        _delete_broadcast(youtube, created_id)
+                        failed.append(f"{title} (miniatura no replicada)")
+                        created_titles.pop()
+                        continue
+                    broadcasts.append(BroadcastItem.from_api(created))
+                    stream_id = shared_stream_id
+                    if stream_id:
+                        _bind_stream_with_retry(
+                            youtube,
+                            created.get("id"),
+                            stream_id,
+                            title,
+                            config.rate_limit_retry_limit,
+                            config.rate_limit_retry_base_seconds,
+                            config.rate_limit_retry_max_seconds,
+                        )
+                        _log(f"BIND: broadcast {created.get('id')} -> stream {stream_id}")
+                    sleep(config.create_pause_seconds)
+                except StopCreationLimit as limit_error:
+                    if config.stop_on_create_limit:
+                        detail_text = limit_error.details or "rateLimitExceeded"
+                        _log(f"STOP: límite alcanzado ({detail_text})")
+                        _log_summary(planned, created_titles, existing_titles, failed)
+                        return 0
+                    failed.append(f"{title} (rate limit: {limit_error.details or 'sin detalle'})")
+                except HttpError as error:
+                    is_limit, detail = _is_quota_or_limit_error(error)
+                    if is_limit and config.stop_on_create_limit:
+                        detail_text = detail or "API limit"
+                        _log(f"STOP: límite alcanzado ({detail_text})")
+                        _log_summary(planned, created_titles, existing_titles, failed)
+                        return 0
+                    _log(f"ERROR: fallo creando '{title}'")
+                    reason, message = _parse_error_reason(error)
+                    if reason or message:
+                        failed.append(f"{title} ({reason or 'error'}: {message or 'sin detalle'})")
+                    else:
+                        failed.append(title)
                     _log_summary(planned, created_titles, existing_titles, failed)
-                    return 0
-                _log(f"ERROR: fallo creando '{title}'")
-                reason, message = _parse_error_reason(error)
-                if reason or message:
-                    failed.append(f"{title} ({reason or 'error'}: {message or 'sin detalle'})")
-                else:
-                    failed.append(title)
-                _log_summary(planned, created_titles, existing_titles, failed)
-                raise
+                    raise
     _log("DONE: reached max days ahead without limit.")
     _log_summary(planned, created_titles, existing_titles, failed)
     return 0
@@ -5,10 +5,10 @@ from datetime import datetime, time, timedelta
 from .config import Config
 from .scheduler import (
     BroadcastDefinition,
-    BroadcastTemplate,
+    BroadcastItem,
     DEFAULT_MISA_DESCRIPTION,
     DEFAULT_VELA_DESCRIPTION,
-    _ensure_template_for_keyword,
+    TemplateFinder,
     _iter_broadcasts,
     _list_scheduled_broadcasts,
     _load_timezone,
@@ -31,8 +31,8 @@ def run_scheduler_studio(youtube, config: Config) -> int:
         BroadcastDefinition(config.keyword_misa_20, time(20, 0), config.keyword_misa_20, DEFAULT_MISA_DESCRIPTION),
         BroadcastDefinition(config.keyword_vela_21, time(21, 0), config.keyword_vela_21, DEFAULT_VELA_DESCRIPTION),
     ]
+    non_thursday_definitions = [d for d in definitions if d.keyword != config.keyword_vela_21]
     start_date = today + timedelta(days=config.start_offset_days)
-    broadcasts = list(_iter_broadcasts(youtube))
     _log(f"START(STUDIO): procesando desde {start_date.isoformat()} (sin saltar huecos).")
     max_days_ahead = min(config.max_days_ahead, 11)
     end_date = today + timedelta(days=max_days_ahead)
@@ -42,18 +42,13 @@ def run_scheduler_studio(youtube, config: Config) -> int:
             f"{start_date.isoformat()} > fin {end_date.isoformat()})."
         )
         return 0
+    broadcasts = list(_iter_broadcasts(youtube))
     total_days = (end_date - start_date).days + 1
     _log_status_list("emisiones programadas detectadas", _list_scheduled_broadcasts(broadcasts, tz))
 
-    templates: dict[str, BroadcastTemplate | None] = {}
+    template_finder = TemplateFinder(broadcasts)
     for definition in definitions:
-        if definition.keyword not in templates:
-            templates[definition.keyword] = _ensure_template_for_keyword(
-                broadcasts,
-                definition.keyword,
-            )
-            if templates[definition.keyword]:
-                _log(f"TEMPLATE: '{definition.keyword}' encontrada.")
+        template_finder.get(definition.keyword)
 
 
     planned: list[str] = []
@@ -68,6 +63,7 @@ def run_scheduler_studio(youtube, config: Config) -> int:
         slow_mo_ms=config.studio_slow_mo_ms,
         log_screenshots=config.studio_log_screenshots,
         log_screenshots_dir=config.studio_log_screenshots_dir,
+        screenshot_full_page=config.studio_screenshot_full_page,
     )
 
     with creator:
@@ -75,10 +71,8 @@ def run_scheduler_studio(youtube, config: Config) -> int:
         for offset in range(total_days):
             target_date = start_date + timedelta(days=offset)
             _log(f"DAY: procesando {target_date.isoformat()}")
-            for definition in definitions:
-                if definition.keyword == config.keyword_vela_21 and target_date.weekday() != 3:
-                    continue
-
+            day_definitions = definitions if target_date.weekday() == 3 else non_thursday_definitions
+            for definition in day_definitions:
                 scheduled_start = datetime.combine(target_date, definition.scheduled_time, tz)
                 title = build_title(definition.prefix, target_date)
                 existing = find_scheduled_broadcast_for_slot_in_items(
@@ -89,7 +83,7 @@ def run_scheduler_studio(youtube, config: Config) -> int:
                     tz=tz,
                 )
                 if existing:
-                    _log(f"SKIP: ya existe '{title}' (id={existing.get('id')})")
+                    _log(f"SKIP: ya existe '{title}' (id={existing.id})")
                     existing_titles.append(title)
                     continue
 
@@ -108,7 +102,7 @@ def run_scheduler_studio(youtube, config: Config) -> int:
                         },
                     }
                     created_titles.append(title)
-                    broadcasts.append(created)
+                    broadcasts.append(BroadcastItem.from_api(created))
                     _log(f"CREATED(STUDIO): '{title}'")
                 except StudioCreationError as studio_error:
                     failed.append(f"{title} (studio error: {studio_error})")
@@ -3,12 +3,35 @@ from __future__ import annotations
 from contextlib import AbstractContextManager
 from dataclasses import dataclass
 from datetime import datetime
+import hashlib
 import json
+import os
 from pathlib import Path
 import re
+import stat
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+try:
+    from playwright.sync_api import (
+        Error as PlaywrightError,
+        TimeoutError as PlaywrightTimeoutError,
+        sync_playwright,
+    )
+except ModuleNotFoundError:
+    PlaywrightError = PlaywrightTimeoutError = Exception
+    sync_playwright = None
+    _PW_AVAILABLE = False
+else:
+    _PW_AVAILABLE = True
 
 
 STUDIO_LIVESTREAM_URL = "https://studio.youtube.com/channel/UCZU9G9HPOLYK-QeaCJo6Fhg/livestreaming"
+PROBE_TIMEOUT_MS = 1500
+_SAFE_LABEL_RE = re.compile(r"[^a-zA-Z0-9_-]+")
 
 
 class StudioCreationError(RuntimeError):
@@ -19,6 +42,20 @@ def _log(message: str) -> None:
     print(message, flush=True)
 
 
+def _any_of(*texts: str) -> re.Pattern[str]:
+    return re.compile("|".join(re.escape(text) for text in texts), re.IGNORECASE)
+
+
+def _skip_capture(_label: str) -> None:
+    return None
+
+
+def _loads_json(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 @dataclass(frozen=True)
 class StudioCreateResult:
     title: str
@@ -36,6 +73,7 @@ class StudioBroadcastCreator(AbstractContextManager["StudioBroadcastCreator"]):
         slow_mo_ms: int,
         log_screenshots: bool,
         log_screenshots_dir: str,
+        screenshot_full_page: bool = False,
     ) -> None:
         self._storage_state_raw = storage_state_path
         self._storage_state_path = Path(storage_state_path)
@@ -44,11 +82,20 @@ class StudioBroadcastCreator(AbstractContextManager["StudioBroadcastCreator"]):
         self._slow_mo_ms = slow_mo_ms
         self._log_screenshots = log_screenshots
         self._log_screenshots_dir = Path(log_screenshots_dir)
+        if screenshot_full_page:
+            self._screenshot_options = {"full_page": True}
+            self._screenshot_extension = "png"
+        else:
+            self._screenshot_options = {"type": "jpeg", "quality": 70}
+            self._screenshot_extension = "jpg"
         self._playwright = None
         self._browser = None
         self._context = None
         self._page = None
         self._screenshot_index = 0
+        self._last_screenshot_digest: bytes | None = None
+        if not log_screenshots:
+            self._capture_state = _skip_capture
 
     def __enter__(self) -> "StudioBroadcastCreator":
         if not self._storage_state_raw.strip():
@@ -57,73 +104,55 @@ class StudioBroadcastCreator(AbstractContextManager["StudioBroadcastCreator"]):
                 "generado por scripts/save_studio_storage_state.py."
             )
 
-        if self._storage_state_path.is_dir():
-            candidate = self._storage_state_path / "storage_state.json"
-            if candidate.is_file():
-                self._storage_state_path = candidate
+        try:
+            path_mode = os.stat(self._storage_state_path).st_mode
+        except OSError as exc:
+            raise StudioCreationError(
+                f"No existe YT_STUDIO_STORAGE_STATE_PATH: {self._storage_state_path}"
+            ) from exc
+
+        if stat.S_ISDIR(path_mode):
+            with os.scandir(self._storage_state_path) as entries:
+                json_names = sorted(
+                    entry.name for entry in entries if entry.name.endswith(".json") and entry.is_file()
+                )
+            if "storage_state.json" in json_names:
+                self._storage_state_path = self._storage_state_path / "storage_state.json"
                 _log(
                     "STUDIO: YT_STUDIO_STORAGE_STATE_PATH es un directorio; "
                     f"usando {self._storage_state_path}."
                 )
+            elif len(json_names) == 1:
+                self._storage_state_path = self._storage_state_path / json_names[0]
+                _log(
+                    "STUDIO: YT_STUDIO_STORAGE_STATE_PATH es un directorio; "
+                    f"usando el único JSON detectado: {self._storage_state_path}."
+                )
+            elif len(json_names) > 1:
+                files_list = ", ".join(json_names)
+                raise StudioCreationError(
+                    "YT_STUDIO_STORAGE_STATE_PATH apunta a un directorio con varios JSON "
+                    f"({files_list}). Debe apuntar explícitamente al archivo correcto."
+                )
             else:
-                json_files = sorted(self._storage_state_path.glob("*.json"))
-                if len(json_files) == 1:
-                    self._storage_state_path = json_files[0]
-                    _log(
-                        "STUDIO: YT_STUDIO_STORAGE_STATE_PATH es un directorio; "
-                        f"usando el único JSON detectado: {self._storage_state_path}."
-                    )
-                elif len(json_files) > 1:
-                    files_list = ", ".join(str(path.name) for path in json_files)
-                    raise StudioCreationError(
-                        "YT_STUDIO_STORAGE_STATE_PATH apunta a un directorio con varios JSON "
-                        f"({files_list}). Debe apuntar explícitamente al archivo correcto."
-                    )
-                else:
-                    raise StudioCreationError(
-                        "YT_STUDIO_STORAGE_STATE_PATH apunta a un directorio. "
-                        "Debe apuntar a un archivo JSON (por ejemplo: storage_state.json)."
-                    )
-
-        if not self._storage_state_path.exists():
-            raise StudioCreationError(
-                f"No existe YT_STUDIO_STORAGE_STATE_PATH: {self._storage_state_path}"
-            )
-        if not self._storage_state_path.is_file():
+                raise StudioCreationError(
+                    "YT_STUDIO_STORAGE_STATE_PATH apunta a un directorio. "
+                    "Debe apuntar a un archivo JSON (por ejemplo: storage_state.json)."
+                )
+        elif not stat.S_ISREG(path_mode):
             raise StudioCreationError(
                 "YT_STUDIO_STORAGE_STATE_PATH debe ser un archivo JSON válido. "
                 f"Valor actual: {self._storage_state_path}"
             )
-        try:
-            with self._storage_state_path.open("r", encoding="utf-8") as storage_file:
-                parsed_storage_state = json.load(storage_file)
-        except json.JSONDecodeError as exc:
-            raise StudioCreationError(
-                "YT_STUDIO_STORAGE_STATE_PATH no contiene JSON válido. "
-                f"Archivo: {self._storage_state_path}"
-            ) from exc
-        except OSError as exc:
-            raise StudioCreationError(
-                "No se pudo leer YT_STUDIO_STORAGE_STATE_PATH. "
-                f"Archivo: {self._storage_state_path}"
-            ) from exc
-
-        if not isinstance(parsed_storage_state, dict):
-            raise StudioCreationError(
-                "YT_STUDIO_STORAGE_STATE_PATH debe contener un objeto JSON con el estado "
-                f"de Playwright. Archivo: {self._storage_state_path}"
-            )
 
+        parsed_storage_state = self._load_storage_state()
         self._ensure_screenshot_directory()
 
         _log(f"STUDIO: usando storage state en {self._storage_state_path}.")
-        try:
-            from playwright.sync_api import Error as PlaywrightError
-            from playwright.sync_api import sync_playwright
-        except ModuleNotFoundError as exc:
+        if not _PW_AVAILABLE:
             raise StudioCreationError(
                 "Playwright no está instalado. Ejecuta `pip install -r requirements.txt`."
-            ) from exc
+            )
 
         self._playwright = sync_playwright().start()
         _log("STUDIO: Playwright iniciado.")
@@ -141,7 +170,7 @@ class StudioBroadcastCreator(AbstractContextManager["StudioBroadcastCreator"]):
             raise
         _log(f"STUDIO: Chromium lanzado (headless={self._headless}, slow_mo_ms={self._slow_mo_ms}).")
         self._context = self._browser.new_context(
-            storage_state=str(self._storage_state_path),
+            storage_state=parsed_storage_state,
             locale="es-ES",
             timezone_id="Europe/Madrid",
         )
@@ -151,6 +180,28 @@ class StudioBroadcastCreator(AbstractContextManager["StudioBroadcastCreator"]):
         self._capture_state("contexto-listo")
         return self
 
+    def _load_storage_state(self) -> dict:
+        try:
+            with self._storage_state_path.open("rb") as storage_file:
+                parsed_storage_state = _loads_json(storage_file.read())
+        except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+            raise StudioCreationError(
+                "YT_STUDIO_STORAGE_STATE_PATH no contiene JSON válido. "
+                f"Archivo: {self._storage_state_path}"
+            ) from exc
+        except OSError as exc:
+            raise StudioCreationError(
+                "No se pudo leer YT_STUDIO_STORAGE_STATE_PATH. "
+                f"Archivo: {self._storage_state_path}"
+            ) from exc
+
+        if not isinstance(parsed_storage_state, dict):
+            raise StudioCreationError(
+                "YT_STUDIO_STORAGE_STATE_PATH debe contener un objeto JSON con el estado "
+                f"de Playwright. Archivo: {self._storage_state_path}"
+            )
+        return parsed_storage_state
+
     def __exit__(self, exc_type, exc, tb) -> None:
         if self._context:
             self._context.close()
@@ -174,22 +225,26 @@ class StudioBroadcastCreator(AbstractContextManager["StudioBroadcastCreator"]):
     ) -> StudioCreateResult:
         page = self.page
         _log(f"STUDIO: abriendo YouTube Studio en {STUDIO_LIVESTREAM_URL}")
-        page.goto(STUDIO_LIVESTREAM_URL, wait_until="domcontentloaded")
-        _log("STUDIO: YouTube Studio cargado (domcontentloaded).")
+        page.goto(STUDIO_LIVESTREAM_URL, wait_until="commit")
+        self._last_screenshot_digest = None
+        schedule_button = page.get_by_role("button", name=_any_of("Programar emisión", "Schedule stream"))
+        try:
+            schedule_button.first.wait_for()
+        except PlaywrightTimeoutError as exc:
+            # P. ej. sesión caducada que redirige al login: el resto de la ejecución debe seguir.
+            raise StudioCreationError(
+                "No se encontró el botón esperado en YouTube Studio ('Programar emisión')."
+            ) from exc
+        _log("STUDIO: YouTube Studio cargado ('Programar emisión' visible).")
         self._capture_state("studio-cargado")
 
         _log("STUDIO STEP 1/8: click en 'Programar emisión'.")
-        self._click_first([
-            page.get_by_role("button", name="Programar emisión"),
-            page.get_by_role("button", name="Schedule stream"),
-        ])
+        self._click_first([schedule_button])
         self._capture_state("step-1-programar-emision")
 
         _log("STUDIO STEP 2/8: abrir 'Configurar con ajustes anteriores'.")
         self._click_first([
-            page.get_by_text("Configurar con ajustes anteriores", exact=False),
-            page.get_by_text("Reuse settings", exact=False),
-            page.get_by_text("ajustes anteriores", exact=False),
+            page.get_by_text(_any_of("ajustes anteriores", "Reuse settings")),
         ])
         self._capture_state("step-2-ajustes-anteriores")
 
@@ -199,8 +254,7 @@ class StudioBroadcastCreator(AbstractContextManager["StudioBroadcastCreator"]):
 
         _log("STUDIO STEP 4/8: click en 'Reutilizar configuración'.")
         self._click_first([
-            page.get_by_role("button", name="Reutilizar configuración"),
-            page.get_by_role("button", name="Reuse settings"),
+            page.get_by_role("button", name=_any_of("Reutilizar configuración", "Reuse settings")),
         ])
         self._capture_state("step-4-reutilizar")
 
@@ -211,7 +265,6 @@ class StudioBroadcastCreator(AbstractContextManager["StudioBroadcastCreator"]):
             page.locator('textarea[aria-label*="Title"]'),
             page.locator('input[aria-label*="Title"]'),
         ])
-        title_box.click()
         title_box.fill(title)
         self._capture_state("step-5-titulo")
 
@@ -224,18 +277,15 @@ class StudioBroadcastCreator(AbstractContextManager["StudioBroadcastCreator"]):
             f"{scheduled_start.strftime('%Y-%m-%d %H:%M %Z')}"
         )
         self._click_first([
-            page.get_by_label("Programar", exact=False),
-            page.get_by_text("Programar", exact=False),
-            page.get_by_label("Schedule", exact=False),
-            page.get_by_text("Schedule", exact=False),
+            page.get_by_label(_any_of("Programar", "Schedule")),
+            page.get_by_text(_any_of("Programar", "Schedule")),
         ])
         self._set_visibility_datetime(scheduled_start)
         self._capture_state("step-7-fecha-hora")
 
         _log("STUDIO STEP 8/8: confirmar con 'Hecho'.")
         self._click_first([
-            page.get_by_role("button", name="Hecho"),
-            page.get_by_role("button", name="Done"),
+            page.get_by_role("button", name=_any_of("Hecho", "Done")),
         ])
         self._capture_state("step-8-hecho")
         _log("STUDIO: emisión programada correctamente desde Studio UI.")
@@ -248,19 +298,17 @@ class StudioBroadcastCreator(AbstractContextManager["StudioBroadcastCreator"]):
 
     def _go_to_visibility_tab(self) -> None:
         page = self.page
+        visibility_tab = page.get_by_role("tab", name=_any_of("Visibilidad", "Visibility")).first
+        next_button = page.get_by_role("button", name=_any_of("Siguiente", "Next"))
         for _ in range(4):
-            if page.get_by_role("tab", name="Visibilidad").count() > 0:
-                page.get_by_role("tab", name="Visibilidad").first.click()
-                return
-            if page.get_by_role("tab", name="Visibility").count() > 0:
-                page.get_by_role("tab", name="Visibility").first.click()
-                return
-
-            if not self._try_click([
-                page.get_by_role("button", name="Siguiente"),
-                page.get_by_role("button", name="Next"),
-            ]):
-                break
+            try:
+                visibility_tab.wait_for(state="visible", timeout=PROBE_TIMEOUT_MS)
+            except PlaywrightTimeoutError:
+                if not self._try_click([next_button]):
+                    break
+                continue
+            visibility_tab.click()
+            return
 
         raise StudioCreationError("No se pudo llegar a la pestaña de Visibilidad.")
 
@@ -269,18 +317,18 @@ class StudioBroadcastCreator(AbstractContextManager["StudioBroadcastCreator"]):
         date_text = scheduled_start.strftime("%d/%m/%Y")
         time_text = scheduled_start.strftime("%H:%M")
 
+        # Locators de Playwright: atraviesan el shadow DOM de los ytcp-* y fill() espera a que
+        # el campo sea editable.
         date_input = self._first_locator([
             page.locator('input[aria-label*="Fecha"]'),
             page.locator('input[aria-label*="Date"]'),
         ])
-        date_input.click()
         date_input.fill(date_text)
 
         time_input = self._first_locator([
             page.locator('input[aria-label*="Hora"]'),
             page.locator('input[aria-label*="Time"]'),
         ])
-        time_input.click()
         time_input.fill(time_text)
 
     def _pick_latest_matching_template(self, keyword: str) -> None:
@@ -292,24 +340,19 @@ class StudioBroadcastCreator(AbstractContextManager["StudioBroadcastCreator"]):
         list_item.first.click()
 
     def _first_locator(self, locators):
+        # Candidatos por orden de prioridad: .first de un selector combinado seguiría el orden
+        # del DOM y un campo o texto anterior ganaría al candidato preferido.
         for locator in locators:
             if locator.count() > 0:
                 return locator.first
         raise StudioCreationError("No se encontró el campo esperado en YouTube Studio.")
 
     def _try_click(self, locators) -> bool:
-        timeout_error = Exception
-        try:
-            from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-            timeout_error = PlaywrightTimeoutError
-        except ModuleNotFoundError:
-            pass
-
         for locator in locators:
             try:
-                locator.first.click(timeout=1500)
+                locator.first.click(timeout=PROBE_TIMEOUT_MS)
                 return True
-            except timeout_error:
+            except PlaywrightTimeoutError:
                 continue
         return False
 
@@ -324,6 +367,7 @@ class StudioBroadcastCreator(AbstractContextManager["StudioBroadcastCreator"]):
 
         if not str(self._log_screenshots_dir).strip():
             self._log_screenshots = False
+            self._capture_state = _skip_capture
             _log("STUDIO: capturas desactivadas porque YT_STUDIO_LOG_SCREENSHOTS_DIR está vacío.")
             return
 
@@ -331,17 +375,29 @@ class StudioBroadcastCreator(AbstractContextManager["StudioBroadcastCreator"]):
         _log(f"STUDIO: capturas de log activadas en {self._log_screenshots_dir}.")
 
     def _capture_state(self, label: str) -> None:
-        if not self._log_screenshots or not self._page:
+        if not self._page:
+            return
+
+        safe_label = _SAFE_LABEL_RE.sub("-", label).strip("-") or "estado"
+        try:
+            screenshot = self._page.screenshot(**self._screenshot_options)
+        except Exception as exc:  # noqa: BLE001
+            _log(f"STUDIO WARN: no se pudo capturar '{safe_label}': {exc}")
+            return
+
+        digest = hashlib.sha256(screenshot).digest()
+        if digest == self._last_screenshot_digest:
+            _log(f"STUDIO SCREENSHOT: sin cambios en '{safe_label}', no se guarda.")
             return
 
-        safe_label = re.sub(r"[^a-zA-Z0-9_-]+", "-", label).strip("-") or "estado"
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
         self._screenshot_index += 1
-        filename = f"{self._screenshot_index:03d}-{timestamp}-{safe_label}.png"
+        filename = f"{self._screenshot_index:03d}-{timestamp}-{safe_label}.{self._screenshot_extension}"
         screenshot_path = self._log_screenshots_dir / filename
 
         try:
-            self._page.screenshot(path=str(screenshot_path), full_page=True)
+            screenshot_path.write_bytes(screenshot)
+            self._last_screenshot_digest = digest
             _log(f"STUDIO SCREENSHOT: {screenshot_path}")
-        except Exception as exc:  # noqa: BLE001
+        except OSError as exc:
             _log(f"STUDIO WARN: no se pudo guardar captura '{screenshot_path}': {exc}")
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from datetime import date
+from functools import lru_cache
 
-WEEKDAYS_ES = [
+WEEKDAYS_ES = (
     "Lunes",
     "Martes",
     "Miércoles",
@@ -10,9 +11,9 @@ WEEKDAYS_ES = [
     "Viernes",
     "Sábado",
     "Domingo",
-]
+)
 
-MONTHS_ES = [
+MONTHS_ES = (
     "enero",
     "febrero",
     "marzo",
@@ -25,14 +26,23 @@ MONTHS_ES = [
     "octubre",
     "noviembre",
     "diciembre",
-]
+)
 
 
+@lru_cache(maxsize=4096)
 def format_spanish_date(target_date: date) -> str:
     month_es = MONTHS_ES[target_date.month - 1]
     return f"{target_date.day} de {month_es}"
 
 
+@lru_cache(maxsize=4096)
 def build_title(prefix: str, target_date: date) -> str:
-    weekday_es = WEEKDAYS_ES[target_date.weekday()]
-    return f"{prefix} - {weekday_es} {format_spanish_date(target_date)}"
+    return "".join((
+        prefix,
+        " - ",
+        WEEKDAYS_ES[target_date.weekday()],
+        " ",
+        str(target_date.day),
+        " de ",
+        MONTHS_ES[target_date.month - 1],
+    ))
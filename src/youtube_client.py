@@ -1,28 +1,85 @@
 from __future__ import annotations
 
+from datetime import datetime
+import hashlib
+import json
+from pathlib import Path
+from typing import Optional
+
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
 
 from .config import Config
+from .file_io import atomic_write_json
+
 
+TOKEN_CACHE_PATH = Path.home() / ".cache" / "canayoutube" / "token.json"
 
 def _log(message: str) -> None:
     print(message, flush=True)
 
 
-def build_youtube_client(config: Config):
-    _log("AUTH: preparando credenciales OAuth para YouTube Data API.")
+def _token_cache_key(config: Config) -> str:
+    return hashlib.sha256(f"{config.client_id}:{config.refresh_token}".encode("utf-8")).hexdigest()
+
+
+def _load_cached_token(cache_key: str) -> Optional[tuple[str, datetime]]:
+    try:
+        payload = json.loads(TOKEN_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("key") != cache_key:
+        return None
+    token = payload.get("token")
+    try:
+        expiry = datetime.fromisoformat(payload["expiry"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if not token:
+        return None
+    return token, expiry
+
+
+def _store_cached_token(cache_key: str, credentials: Credentials) -> None:
+    if not credentials.token or not credentials.expiry:
+        return
+    payload = {
+        "key": cache_key,
+        "token": credentials.token,
+        "expiry": credentials.expiry.isoformat(),
+    }
+    try:
+        atomic_write_json(TOKEN_CACHE_PATH, payload)
+    except OSError as exc:
+        _log(f"WARN: no se pudo guardar el access token en caché ({exc}).")
+
+
+def _get_credentials(config: Config) -> Credentials:
+    token, expiry = _load_cached_token(_token_cache_key(config)) or (None, None)
     credentials = Credentials(
-        token=None,
+        token=token,
+        expiry=expiry,
         refresh_token=config.refresh_token,
         token_uri="https://oauth2.googleapis.com/token",
         client_id=config.client_id,
         client_secret=config.client_secret,
         scopes=["https://www.googleapis.com/auth/youtube"],
     )
+
+    if credentials.valid:
+        _log("AUTH: reutilizando access token vigente en caché.")
+        return credentials
+
     _log("AUTH: solicitando access token a Google OAuth...")
     credentials.refresh(Request())
     _log("AUTH: token obtenido correctamente.")
+    _store_cached_token(_token_cache_key(config), credentials)
+    return credentials
+
+
+def build_youtube_client(config: Config):
+    _log("AUTH: preparando credenciales OAuth para YouTube Data API.")
+    credentials = _get_credentials(config)
     _log("API: construyendo cliente youtube v3.")
     return build("youtube", "v3", credentials=credentials)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+
+_ROOT = Path(__file__).resolve().parent.parent
+# "á" or "ñ" written as UTF-8 and read back as latin-1 start with U+00C3 (A with tilde).
+_MOJIBAKE_MARKER = "\u00c3"
+
+
+# Wednesday, so "tomorrow" is always a Thursday and the 21h vigil is scheduled.
+FROZEN_NOW = datetime(2024, 1, 3, tzinfo=timezone.utc)
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        if tz is None:
+            return FROZEN_NOW.replace(tzinfo=None)
+        return FROZEN_NOW.astimezone(tz)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _frozen_clock():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.scheduler.datetime", _FrozenDatetime)
+        mp.setattr("src.scheduler_studio.datetime", _FrozenDatetime)
+        yield
+
+
+def _no_sleep(_seconds):
+    return None
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _skip_sleeps():
+    # Retry backoff and create pauses must never cost wall-clock time in tests, including the
+    # module-scoped fixtures that call run_scheduler before any function-scoped fixture runs.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.scheduler.sleep", _no_sleep)
+        yield
+
+
+def pytest_sessionstart(session):
+    # Titles and log messages are Spanish; catch sources saved with a wrong encoding before any test runs.
+    for path in sorted((_ROOT / "src").glob("*.py")) + sorted((_ROOT / "tests").glob("*.py")):
+        try:
+            text = path.read_bytes().decode("utf-8")
+        except UnicodeDecodeError as exc:
+            raise pytest.UsageError(f"{path.relative_to(_ROOT)} no está en UTF-8 ({exc}).") from exc
+        if _MOJIBAKE_MARKER in text:
+            raise pytest.UsageError(f"{path.relative_to(_ROOT)} contiene texto doblemente codificado (mojibake).")
@@ -0,0 +1,25 @@
+import json
+
+import pytest
+
+from src.file_io import atomic_write_json
+
+
+def test_writes_json_and_leaves_no_temp_file(tmp_path) -> None:
+    target = tmp_path / "nested" / "state.json"
+
+    atomic_write_json(target, {"cookies": []})
+
+    assert json.loads(target.read_text(encoding="utf-8")) == {"cookies": []}
+    assert [path.name for path in target.parent.iterdir()] == ["state.json"]
+
+
+def test_failed_write_keeps_previous_file_and_removes_temp_file(tmp_path) -> None:
+    target = tmp_path / "state.json"
+    target.write_text('{"previo": true}', encoding="utf-8")
+
+    with pytest.raises(TypeError):
+        atomic_write_json(target, {"no-serializable": object()})
+
+    assert json.loads(target.read_text(encoding="utf-8")) == {"previo": True}
+    assert [path.name for path in tmp_path.iterdir()] == ["state.json"]
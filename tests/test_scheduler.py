@@ -1,25 +1,67 @@
 from __future__ import annotations
 
-import unittest
 from unittest.mock import patch
-from datetime import datetime, timedelta
+from dataclasses import replace
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 import json
-from types import SimpleNamespace
+from types import MappingProxyType, SimpleNamespace
 from zoneinfo import ZoneInfo
 
 from googleapiclient.errors import HttpError
+import pytest
 
+from src import scheduler_studio
 from src.config import Config
 from src.scheduler import (
     DEFAULT_MISA_DESCRIPTION,
     DEFAULT_VELA_DESCRIPTION,
+    _backoff_delays,
     _iter_broadcasts,
+    _parse_error_reason,
+    find_latest_scheduled_broadcast,
     run_scheduler,
 )
 from src.title_format import build_title
 
 
+_UTC = ZoneInfo("UTC")
+_MIDNIGHT = time()
+_NOON = time(12)
+
+
+# Matches the frozen clock in conftest.py.
+_TODAY = date(2024, 1, 3)
+
+
+@lru_cache(maxsize=None)
+def _iso_midnight(offset_days: int) -> str:
+    return datetime.combine(_TODAY + timedelta(days=offset_days), _MIDNIGHT, _UTC).isoformat()
+
+
+_BASE_CONFIG = Config(
+    client_id="id",
+    client_secret="secret",
+    refresh_token="token",
+    timezone="UTC",
+    default_privacy_status="unlisted",
+    keyword_misa_10="Misa 10h",
+    keyword_misa_12="Misa 12h",
+    keyword_misa_20="Misa 20h",
+    keyword_vela_21="Vela 21h",
+    start_offset_days=1,
+    max_days_ahead=1,
+    stop_on_create_limit=True,
+    rate_limit_retry_limit=1,
+    rate_limit_retry_base_seconds=0.0,
+    rate_limit_retry_max_seconds=0.0,
+    create_pause_seconds=0.0,
+)
+
+
 class _FakeRequest:
+    __slots__ = ("_payload",)
+
     def __init__(self, payload):
         self._payload = payload
 
@@ -27,86 +69,166 @@ class _FakeRequest:
         return self._payload
 
 
+# Shared empty response: the scheduler never mutates what bind/delete/thumbnails return.
+_EMPTY_REQUEST = _FakeRequest({})
+_NO_ITEMS_REQUEST = _FakeRequest({"items": []})
+
+
 class _FakeLiveBroadcasts:
+    __slots__ = (
+        "_items",
+        "_list_request",
+        "_created_index",
+        "_created_snippets",
+        "_created_content_details",
+        "_list_cache",
+        "_rev",
+        "body_by_title",
+        "desc_by_title",
+        "inserted_bodies",
+        "inserted_rows",
+        "inserted_titles",
+        "bound_streams",
+        "deleted_ids",
+        "updated_bodies",
+    )
+
     def __init__(self, items):
         self._items = items
-        self._created_by_id = {}
+        self._list_request = _FakeRequest({"items": items})
+        # Created broadcasts as parallel columns, looked up through an id -> row index.
+        self._created_index: dict[str, int] = {}
+        self._created_snippets: list[dict] = []
+        self._created_content_details: list[dict] = []
+        # list(id=...) responses keyed by id, reused until insert()/update() bumps the revision.
+        self._list_cache: dict[str, tuple[int, _FakeRequest]] = {}
+        self._rev = 0
+        # Scheduled inserts indexed by title, so tests read them back without rescanning.
+        self.body_by_title: dict[str, dict] = {}
+        self.desc_by_title: dict[str, str] = {}
         self.inserted_bodies = []
+        self.inserted_rows = []
+        self.inserted_titles: set[str] = set()
         self.bound_streams = []
         self.deleted_ids = []
         self.updated_bodies = []
-        self.force_insert_chat_enabled = False
-        self.force_list_chat_enabled = False
 
     def list(self, **kwargs):
         broadcast_id = kwargs.get("id")
         if broadcast_id:
-            item = self._created_by_id.get(broadcast_id)
-            if item:
-                listed_item = dict(item)
-                listed_content = dict(listed_item.get("contentDetails", {}))
-                if self.force_list_chat_enabled:
-                    listed_content["enableLiveChat"] = True
-                listed_item["contentDetails"] = listed_content
-                return _FakeRequest({"items": [listed_item]})
-            return _FakeRequest({"items": []})
-        return _FakeRequest({"items": self._items})
+            cached = self._list_cache.get(broadcast_id)
+            if cached is not None and cached[0] == self._rev:
+                return cached[1]
+            row = self._created_index.get(broadcast_id)
+            if row is None:
+                return _NO_ITEMS_REQUEST
+            listed_item = MappingProxyType(
+                {
+                    "id": broadcast_id,
+                    "snippet": self._created_snippets[row],
+                    "contentDetails": self._listed_content_details(row),
+                }
+            )
+            request = _FakeRequest({"items": [listed_item]})
+            self._list_cache[broadcast_id] = (self._rev, request)
+            return request
+        return self._list_request
 
     def insert(self, **kwargs):
+        self._rev += 1
         body = kwargs["body"]
         self.inserted_bodies.append(body)
-        title = body["snippet"]["title"]
+        snippet = body["snippet"]
+        title = snippet["title"]
+        self.inserted_rows.append((title, snippet.get("description"), snippet.get("scheduledStartTime")))
+        self.inserted_titles.add(title)
+        if "scheduledStartTime" in snippet:
+            self.body_by_title[title] = body
+            self.desc_by_title[title] = snippet.get("description")
         created_payload = {
             "id": f"created-{len(self.inserted_bodies)}",
             "snippet": {"title": title},
         }
-        if self.force_insert_chat_enabled:
-            created_payload["contentDetails"] = {
-                "enableLiveChat": True,
-                "enableLiveChatReplay": True,
-                "enableLiveChatSummary": True,
-            }
-        self._created_by_id[created_payload["id"]] = created_payload
+        self._created_index[created_payload["id"]] = len(self._created_snippets)
+        self._created_snippets.append(created_payload["snippet"])
+        self._created_content_details.append(created_payload.get("contentDetails", {}))
         return _FakeRequest(created_payload)
 
+    def _listed_content_details(self, row):
+        return self._created_content_details[row]
+
     def bind(self, **kwargs):
         self.bound_streams.append((kwargs.get("id"), kwargs.get("streamId")))
-        return _FakeRequest({})
+        return _EMPTY_REQUEST
 
     def delete(self, **kwargs):
         self.deleted_ids.append(kwargs.get("id"))
-        return _FakeRequest({})
+        return _EMPTY_REQUEST
 
     def update(self, **kwargs):
+        self._rev += 1
         body = kwargs["body"]
         self.updated_bodies.append(body)
-        item = self._created_by_id.get(body.get("id"))
-        if item:
-            item["contentDetails"] = {
-                **item.get("contentDetails", {}),
-                **body.get("contentDetails", {}),
-            }
-        return _FakeRequest(kwargs["body"])
+        row = self._created_index.get(body.get("id"))
+        if row is not None:
+            self._created_content_details[row] |= body.get("contentDetails", {})
+        return _FakeRequest(body)
+
+
+class _ChatForceInsertBroadcasts(_FakeLiveBroadcasts):
+    # The API answers insert() with live chat still enabled.
+    __slots__ = ()
+
+    def insert(self, **kwargs):
+        created_payload = super().insert(**kwargs).execute()
+        created_payload["contentDetails"] = {
+            "enableLiveChat": True,
+            "enableLiveChatReplay": True,
+            "enableLiveChatSummary": True,
+        }
+        self._created_content_details[-1] = created_payload["contentDetails"]
+        return _FakeRequest(created_payload)
+
+
+class _ChatForceListBroadcasts(_FakeLiveBroadcasts):
+    # insert() looks clean, but the verification list() still reports live chat enabled.
+    __slots__ = ()
+
+    def _listed_content_details(self, row):
+        return {**self._created_content_details[row], "enableLiveChat": True}
+
+
+_LIVE_BROADCASTS_BY_CHAT_MODE = {
+    None: _FakeLiveBroadcasts,
+    "insert": _ChatForceInsertBroadcasts,
+    "list": _ChatForceListBroadcasts,
+}
 
 
 class _FakeYoutube:
-    def __init__(self, items):
-        self._live = _FakeLiveBroadcasts(items)
+    __slots__ = ("_live",)
+
+    def __init__(self, items, chat_mode=None):
+        self._live = _LIVE_BROADCASTS_BY_CHAT_MODE[chat_mode](items)
 
     def liveBroadcasts(self):
         return self._live
 
 
 class _FakeThumbnails:
+    __slots__ = ("calls",)
+
     def __init__(self):
         self.calls = []
 
     def set(self, **kwargs):
         self.calls.append(kwargs)
-        return _FakeRequest({})
+        return _EMPTY_REQUEST
 
 
 class _ThumbnailUploadYoutube(_FakeYoutube):
+    __slots__ = ("_thumbs",)
+
     def __init__(self, items):
         super().__init__(items)
         self._thumbs = _FakeThumbnails()
@@ -115,8 +237,33 @@ class _ThumbnailUploadYoutube(_FakeYoutube):
         return self._thumbs
 
 
+class _FakeThumbnailHeaders:
+    __slots__ = ()
+
+    @staticmethod
+    def get_content_type():
+        return "image/jpeg"
+
+
+class _FakeThumbnailResponse:
+    __slots__ = ()
+
+    headers = _FakeThumbnailHeaders()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    @staticmethod
+    def read():
+        return b"img"
+
 
 class _FakeStudioCreator:
+    __slots__ = ("calls",)
+
     def __init__(self, **_kwargs):
         self.calls = []
 
@@ -131,48 +278,117 @@ class _FakeStudioCreator:
 
 
 class _NoThumbnailUploadYoutube(_FakeYoutube):
+    __slots__ = ()
+
     def thumbnails(self):
         raise AssertionError("No debe intentar subir miniaturas")
 
 
+class _RecordingListLiveBroadcasts(_FakeLiveBroadcasts):
+    __slots__ = ("list_calls",)
+
+    def __init__(self, items):
+        super().__init__(items)
+        self.list_calls = []
+
+    def list(self, **kwargs):
+        self.list_calls.append(kwargs)
+        return super().list(**kwargs)
+
+
+class _RecordingListYoutube(_FakeYoutube):
+    __slots__ = ()
+
+    def __init__(self, items):
+        self._live = _RecordingListLiveBroadcasts(items)
+
+
+class _PagedLiveBroadcasts(_FakeLiveBroadcasts):
+    __slots__ = ("_pages",)
+
+    def __init__(self, pages):
+        super().__init__([])
+        self._pages = pages
+
+    def list(self, **kwargs):
+        page_index = int(kwargs.get("pageToken") or 0)
+        response = {"items": self._pages[page_index]}
+        if page_index + 1 < len(self._pages):
+            response["nextPageToken"] = str(page_index + 1)
+        return _FakeRequest(response)
+
+
+class _PagedYoutube(_FakeYoutube):
+    __slots__ = ()
+
+    def __init__(self, pages):
+        self._live = _PagedLiveBroadcasts(pages)
+
+
+class _NoListYoutube(_FakeYoutube):
+    __slots__ = ()
+
+    def liveBroadcasts(self):
+        raise AssertionError("No debe listar emisiones")
+
+
+_RATE_LIMIT_RESP = SimpleNamespace(status=403, reason="Forbidden")
+_RATE_LIMIT_CONTENT = json.dumps(
+    {
+        "error": {
+            "errors": [{"reason": "userRequestsExceedRateLimit", "message": "Quota exceeded"}],
+            "message": "Quota exceeded",
+        }
+    }
+).encode("utf-8")
+
+
 class _AlwaysRateLimitLiveBroadcasts(_FakeLiveBroadcasts):
+    __slots__ = ()
+
     def insert(self, **_kwargs):
-        payload = {
-            "error": {
-                "errors": [{"reason": "userRequestsExceedRateLimit", "message": "Quota exceeded"}],
-                "message": "Quota exceeded",
-            }
-        }
-        raise HttpError(SimpleNamespace(status=403, reason="Forbidden"), json.dumps(payload).encode("utf-8"))
+        raise HttpError(_RATE_LIMIT_RESP, _RATE_LIMIT_CONTENT)
 
 
 class _AlwaysRateLimitYoutube(_FakeYoutube):
+    __slots__ = ()
+
     def __init__(self, items):
         self._live = _AlwaysRateLimitLiveBroadcasts(items)
 
 
+_SERVICE_UNAVAILABLE_RESP = SimpleNamespace(status=503, reason="Service Unavailable")
+_SERVICE_UNAVAILABLE_CONTENT = json.dumps(
+    {
+        "error": {
+            "errors": [{"reason": "SERVICE_UNAVAILABLE", "message": "The service is currently unavailable."}],
+            "message": "The service is currently unavailable.",
+        }
+    }
+).encode("utf-8")
+
+
+_SERVICE_UNAVAILABLE_ERROR = HttpError(_SERVICE_UNAVAILABLE_RESP, _SERVICE_UNAVAILABLE_CONTENT)
+
+
+def _raise_service_unavailable():
+    raise _SERVICE_UNAVAILABLE_ERROR
+
+
 class _Retry503Request:
+    # First execute() fails with a 503, the retry gets the payload.
+    __slots__ = ("_outcomes",)
+
     def __init__(self, payload):
-        self._payload = payload
-        self._attempts = 0
+        self._outcomes = iter((_raise_service_unavailable, lambda: payload))
 
     def execute(self):
-        self._attempts += 1
-        if self._attempts == 1:
-            payload = {
-                "error": {
-                    "errors": [{"reason": "SERVICE_UNAVAILABLE", "message": "The service is currently unavailable."}],
-                    "message": "The service is currently unavailable.",
-                }
-            }
-            raise HttpError(
-                SimpleNamespace(status=503, reason="Service Unavailable"),
-                json.dumps(payload).encode("utf-8"),
-            )
-        return self._payload
+        return next(self._outcomes)()
 
 
 class _Retry503LiveBroadcasts(_FakeLiveBroadcasts):
+    __slots__ = ()
+
     def list(self, **kwargs):
         broadcast_id = kwargs.get("id")
         if broadcast_id:
@@ -181,644 +397,479 @@ class _Retry503LiveBroadcasts(_FakeLiveBroadcasts):
 
 
 class _Retry503Youtube(_FakeYoutube):
+    __slots__ = ()
+
     def __init__(self, items):
         self._live = _Retry503LiveBroadcasts(items)
 
 
-class SchedulerTests(unittest.TestCase):
-    @patch("src.scheduler.sleep", return_value=None)
-    def test_iter_broadcasts_retries_on_service_unavailable(self, _sleep_mock) -> None:
-        youtube = _Retry503Youtube([{"id": "ok", "snippet": {"title": "Misa 10h"}}])
-
-        broadcasts = list(_iter_broadcasts(youtube))
-
-        self.assertEqual(len(broadcasts), 1)
-        self.assertEqual(broadcasts[0]["id"], "ok")
-
-    def test_caps_schedule_window_to_fifteen_days(self) -> None:
-        tz = ZoneInfo("UTC")
-        today = datetime.now(tz).date()
-        template_items = [
-            {
-                "id": f"template-{keyword}",
-                "snippet": {
-                    "title": f"{keyword} plantilla",
-                    "description": f"{keyword} desc",
-                    "scheduledStartTime": datetime.combine(today, datetime.min.time(), tz).isoformat(),
-                },
-                "contentDetails": {},
-                "status": {"privacyStatus": "unlisted"},
-            }
-            for keyword in ("Misa 10h", "Misa 12h", "Misa 20h", "Vela 21h")
+def _make_item(
+    item_id: str,
+    title: str,
+    start_iso: str,
+    *,
+    description: str | None = None,
+    ended: bool = False,
+    bound_stream: str | None = None,
+    thumbnail_url: str | None = None,
+) -> dict:
+    snippet = {"title": title, "scheduledStartTime": start_iso}
+    if description is not None:
+        snippet["description"] = description
+    if ended:
+        snippet["actualEndTime"] = start_iso
+    if thumbnail_url:
+        snippet["thumbnails"] = {"high": {"url": thumbnail_url}}
+    return {
+        "id": item_id,
+        "snippet": snippet,
+        "contentDetails": {"boundStreamId": bound_stream} if bound_stream else {},
+        "status": {"privacyStatus": "unlisted"},
+    }
+
+
+# run_scheduler only reads template items, so one read-only instance per shape is shared across tests.
+@lru_cache(maxsize=None)
+def _make_template(keyword: str, start_iso: str, *, thumbnail_url: str | None = None) -> MappingProxyType:
+    return MappingProxyType(
+        _make_item(
+            f"template-{keyword}",
+            f"{keyword} plantilla",
+            start_iso,
+            description=f"{keyword} desc",
+            thumbnail_url=thumbnail_url,
+        )
+    )
+
+
+@pytest.fixture(scope="module")
+def config() -> Config:
+    return _BASE_CONFIG
+
+
+@pytest.fixture(scope="module")
+def make_config():
+    # Each test passes only the fields it varies from the base config.
+    def _make_config(**overrides) -> Config:
+        return replace(_BASE_CONFIG, **overrides)
+
+    return _make_config
+
+
+@pytest.fixture(scope="module")
+def tomorrow() -> date:
+    return _TODAY + timedelta(days=1)
+
+
+def test_iter_broadcasts_retries_on_service_unavailable() -> None:
+    youtube = _Retry503Youtube([{"id": "ok", "snippet": {"title": "Misa 10h"}}])
+
+    broadcasts = list(_iter_broadcasts(youtube))
+
+    assert len(broadcasts) == 1
+    assert broadcasts[0].id == "ok"
+
+
+def test_iter_broadcasts_follows_pages_in_order() -> None:
+    youtube = _PagedYoutube(
+        [
+            [{"id": "p1-a", "snippet": {"title": "Misa 10h"}}, {"id": "p1-b", "snippet": {"title": "Misa 12h"}}],
+            [{"id": "p2-a", "snippet": {"title": "Misa 20h"}}],
+            [{"id": "p3-a", "snippet": {"title": "Vela 21h"}}],
         ]
+    )
 
-        youtube = _FakeYoutube(template_items)
-        config = Config(
-            client_id="id",
-            client_secret="secret",
-            refresh_token="token",
-            timezone="UTC",
-            default_privacy_status="unlisted",
-            keyword_misa_10="Misa 10h",
-            keyword_misa_12="Misa 12h",
-            keyword_misa_20="Misa 20h",
-            keyword_vela_21="Vela 21h",
-            start_offset_days=1,
-            max_days_ahead=30,
-            stop_on_create_limit=True,
-            rate_limit_retry_limit=1,
-            rate_limit_retry_base_seconds=0.0,
-            rate_limit_retry_max_seconds=0.0,
-            create_pause_seconds=0.0,
-        )
+    broadcasts = list(_iter_broadcasts(youtube))
 
-        run_scheduler(youtube, config)
+    assert [item.id for item in broadcasts] == ["p1-a", "p1-b", "p2-a", "p3-a"]
 
-        scheduled_dates = {
-            datetime.fromisoformat(body["snippet"]["scheduledStartTime"]).date()
-            for body in youtube._live.inserted_bodies
-            if "scheduledStartTime" in body["snippet"]
-        }
-        self.assertIn(today + timedelta(days=11), scheduled_dates)
-        self.assertNotIn(today + timedelta(days=12), scheduled_dates)
-
-    def test_creates_without_template_and_without_skipping_start_day(self) -> None:
-        tz = ZoneInfo("UTC")
-        today = datetime.now(tz).date()
-        tomorrow = today + timedelta(days=1)
-        # Existing broadcast in the future should not shift start date.
-        future_item = {
-            "id": "future",
-            "snippet": {
-                "title": "Misa 10h - 31 de diciembre",
-                "scheduledStartTime": datetime.combine(today + timedelta(days=10), datetime.min.time(), tz).isoformat(),
-            },
-            "contentDetails": {},
-            "status": {"privacyStatus": "unlisted"},
-        }
 
-        youtube = _FakeYoutube([future_item])
-        config = Config(
-            client_id="id",
-            client_secret="secret",
-            refresh_token="token",
-            timezone="UTC",
-            default_privacy_status="unlisted",
-            keyword_misa_10="Misa 10h",
-            keyword_misa_12="Misa 12h",
-            keyword_misa_20="Misa 20h",
-            keyword_vela_21="Vela 21h",
-            start_offset_days=1,
-            max_days_ahead=1,
-            stop_on_create_limit=True,
-            rate_limit_retry_limit=3,
-            rate_limit_retry_base_seconds=0.0,
-            rate_limit_retry_max_seconds=0.0,
-            create_pause_seconds=0.0,
-        )
+def test_latest_scheduled_lookup_counts_past_broadcasts() -> None:
+    past_start = datetime.combine(_TODAY - timedelta(days=3), _MIDNIGHT, _UTC)
+    youtube = _RecordingListYoutube(
+        [{"id": "past", "snippet": {"title": "Misa 10h", "scheduledStartTime": past_start.isoformat()}}]
+    )
 
-        exit_code = run_scheduler(youtube, config)
-        self.assertEqual(exit_code, 0)
-
-        created_titles = [body["snippet"]["title"] for body in youtube._live.inserted_bodies]
-        self.assertIn(build_title("Misa 10h", tomorrow), created_titles)
-        self.assertIn(build_title("Misa 12h", tomorrow), created_titles)
-        self.assertIn(build_title("Misa 20h", tomorrow), created_titles)
-
-    def test_studio_mode_skips_api_insert_and_uses_ui_creator(self) -> None:
-        tz = ZoneInfo("UTC")
-        today = datetime.now(tz).date()
-        template_item = {
-            "id": "template-10",
-            "snippet": {
-                "title": "Misa 10h histórica",
-                "description": "Descripción emitida",
-                "scheduledStartTime": datetime.combine(today, datetime.min.time(), tz).isoformat(),
-                "actualEndTime": datetime.combine(today, datetime.min.time(), tz).isoformat(),
-            },
-            "contentDetails": {"boundStreamId": "stream-shared"},
-            "status": {"privacyStatus": "unlisted"},
-        }
+    latest = find_latest_scheduled_broadcast(youtube, ["Misa 10h"], _UTC)
 
-        youtube = _FakeYoutube([template_item])
-        config = Config(
-            client_id="id",
-            client_secret="secret",
-            refresh_token="token",
-            timezone="UTC",
-            default_privacy_status="unlisted",
-            keyword_misa_10="Misa 10h",
-            keyword_misa_12="Misa 12h",
-            keyword_misa_20="Misa 20h",
-            keyword_vela_21="Vela 21h",
-            start_offset_days=1,
-            max_days_ahead=1,
-            stop_on_create_limit=True,
-            rate_limit_retry_limit=1,
-            rate_limit_retry_base_seconds=0.0,
-            rate_limit_retry_max_seconds=0.0,
-            create_pause_seconds=0.0,
-            creation_mode="studio_ui",
-            studio_storage_state_path="fake.json",
-        )
+    assert latest == past_start
+    assert youtube._live.list_calls[0]["mine"] is True
+    assert "broadcastStatus" not in youtube._live.list_calls[0]
 
-        with patch("src.scheduler_studio.StudioBroadcastCreator", _FakeStudioCreator):
-            run_scheduler(youtube, config)
-
-        self.assertEqual(len(youtube._live.inserted_bodies), 0)
-
-    def test_does_not_upload_thumbnail_when_reusing_metadata(self) -> None:
-        tz = ZoneInfo("UTC")
-        today = datetime.now(tz).date()
-        template_item = {
-            "id": "template-10",
-            "snippet": {
-                "title": "Misa 10h histórica",
-                "description": "Descripción emitida",
-                "scheduledStartTime": datetime.combine(today, datetime.min.time(), tz).isoformat(),
-                "actualEndTime": datetime.combine(today, datetime.min.time(), tz).isoformat(),
-                "thumbnails": {"high": {"url": "https://example.org/thumb.jpg"}},
-            },
-            "contentDetails": {"boundStreamId": "stream-shared"},
-            "status": {"privacyStatus": "unlisted"},
-        }
 
-        youtube = _NoThumbnailUploadYoutube([template_item])
-        config = Config(
-            client_id="id",
-            client_secret="secret",
-            refresh_token="token",
-            timezone="UTC",
-            default_privacy_status="unlisted",
-            keyword_misa_10="Misa 10h",
-            keyword_misa_12="Misa 12h",
-            keyword_misa_20="Misa 20h",
-            keyword_vela_21="Vela 21h",
-            start_offset_days=1,
-            max_days_ahead=1,
-            stop_on_create_limit=True,
-            rate_limit_retry_limit=1,
-            rate_limit_retry_base_seconds=0.0,
-            rate_limit_retry_max_seconds=0.0,
-            create_pause_seconds=0.0,
-        )
+def test_backoff_delays_double_until_capped() -> None:
+    assert _backoff_delays(4, 1.0, 5.0) == (1.0, 2.0, 4.0, 5.0, 5.0)
 
-        run_scheduler(youtube, config)
 
-        tomorrow = today + timedelta(days=1)
-        misa_10_title = build_title("Misa 10h", tomorrow)
-        description_by_title = {
-            body["snippet"]["title"]: body["snippet"]["description"]
-            for body in youtube._live.inserted_bodies
-            if "scheduledStartTime" in body["snippet"]
-        }
-        self.assertEqual(description_by_title[misa_10_title], "Descripción emitida")
-
-    def test_uses_latest_emitted_template_for_same_keyword(self) -> None:
-        tz = ZoneInfo("UTC")
-        today = datetime.now(tz).date()
-
-        old_emitted_10 = {
-            "id": "old-emitted-10",
-            "snippet": {
-                "title": "Misa 10h antigua",
-                "description": "Desc vieja 10",
-                "scheduledStartTime": datetime.combine(today - timedelta(days=5), datetime.min.time(), tz).isoformat(),
-                "actualEndTime": datetime.combine(today - timedelta(days=5), datetime.min.time(), tz).isoformat(),
-            },
-            "contentDetails": {"boundStreamId": "stream-emitted"},
-            "status": {"privacyStatus": "unlisted"},
-        }
-        latest_emitted_10 = {
-            "id": "latest-emitted-10",
-            "snippet": {
-                "title": "Misa 10h última",
-                "description": "Desc última 10",
-                "scheduledStartTime": datetime.combine(today - timedelta(days=1), datetime.min.time(), tz).isoformat(),
-                "actualEndTime": datetime.combine(today - timedelta(days=1), datetime.min.time(), tz).isoformat(),
-            },
-            "contentDetails": {"boundStreamId": "stream-emitted"},
-            "status": {"privacyStatus": "unlisted"},
-        }
-        latest_emitted_12 = {
-            "id": "latest-emitted-12",
-            "snippet": {
-                "title": "Misa 12h última",
-                "description": "Desc última 12",
-                "scheduledStartTime": datetime.combine(today - timedelta(days=1), datetime.min.time(), tz).isoformat(),
-                "actualEndTime": datetime.combine(today - timedelta(days=1), datetime.min.time(), tz).isoformat(),
-            },
-            "contentDetails": {},
-            "status": {"privacyStatus": "unlisted"},
+def test_parse_error_reason_decodes_payload_once() -> None:
+    payload = {
+        "error": {
+            "errors": [{"reason": "quotaExceeded", "message": "Quota exceeded"}],
+            "message": "Quota exceeded",
         }
+    }
+    error = HttpError(SimpleNamespace(status=403, reason="Forbidden"), json.dumps(payload).encode("utf-8"))
+
+    with patch("src.scheduler.json.loads", wraps=json.loads) as loads_mock:
+        first = _parse_error_reason(error)
+        second = _parse_error_reason(error)
+
+    assert first == ("quotaExceeded", "Quota exceeded")
+    assert second == first
+    assert loads_mock.call_count == 1
+
+
+def test_caps_schedule_window_to_fifteen_days(make_config) -> None:
+    template_items = [
+        _make_template(keyword, _iso_midnight(0)) for keyword in ("Misa 10h", "Misa 12h", "Misa 20h", "Vela 21h")
+    ]
+
+    youtube = _FakeYoutube(template_items)
+    config = make_config(max_days_ahead=12)
+
+    run_scheduler(youtube, config)
+
+    # Scheduler timestamps are ISO strings starting with YYYY-MM-DD; no need to parse them.
+    scheduled_dates = {start[:10] for _title, _description, start in youtube._live.inserted_rows if start}
+    assert (_TODAY + timedelta(days=11)).isoformat() in scheduled_dates
+    assert (_TODAY + timedelta(days=12)).isoformat() not in scheduled_dates
+
+
+def test_skips_listing_when_start_offset_is_beyond_window(make_config) -> None:
+    youtube = _NoListYoutube([])
+    config = make_config(start_offset_days=5, max_days_ahead=2)
+
+    assert run_scheduler(youtube, config) == 0
+
+
+@pytest.mark.parametrize(
+    ("youtube_cls", "items", "expected_descriptions", "absent_keywords"),
+    [
+        pytest.param(
+            _FakeYoutube,
+            # Existing broadcast in the future should not shift start date.
+            [_make_item("future", "Misa 10h - 31 de diciembre", _iso_midnight(10))],
+            {"Misa 10h": None, "Misa 12h": None, "Misa 20h": None},
+            (),
+            id="creates-without-template-and-without-skipping-start-day",
+        ),
+        pytest.param(
+            _NoThumbnailUploadYoutube,
+            [
+                _make_item(
+                    "template-10",
+                    "Misa 10h histórica",
+                    _iso_midnight(0),
+                    description="Descripción emitida",
+                    ended=True,
+                    bound_stream="stream-shared",
+                    thumbnail_url="https://example.org/thumb.jpg",
+                )
+            ],
+            {"Misa 10h": "Descripción emitida"},
+            (),
+            id="does-not-upload-thumbnail-when-reusing-metadata",
+        ),
+        pytest.param(
+            _NoThumbnailUploadYoutube,
+            [
+                _make_item(
+                    "old-emitted-10",
+                    "Misa 10h antigua",
+                    _iso_midnight(-5),
+                    description="Desc vieja 10",
+                    ended=True,
+                    bound_stream="stream-emitted",
+                ),
+                _make_item(
+                    "latest-emitted-10",
+                    "Misa 10h última",
+                    _iso_midnight(-1),
+                    description="Desc última 10",
+                    ended=True,
+                    bound_stream="stream-emitted",
+                ),
+                _make_item(
+                    "latest-emitted-12",
+                    "Misa 12h última",
+                    _iso_midnight(-1),
+                    description="Desc última 12",
+                    ended=True,
+                ),
+            ],
+            {"Misa 10h": "Desc última 10", "Misa 12h": "Desc última 12"},
+            (),
+            id="uses-latest-emitted-template-for-same-keyword",
+        ),
+        pytest.param(
+            _FakeYoutube,
+            [
+                _make_item(
+                    "existing-misa-12",
+                    "Misa 12h - Evento ya creado manualmente",
+                    datetime.combine(_TODAY + timedelta(days=1), _NOON, _UTC).isoformat(),
+                    description="Desc previa",
+                )
+            ],
+            {},
+            ("Misa 12h",),
+            id="skips-creation-when-same-slot-exists-even-with-different-title",
+        ),
+    ],
+)
+def test_inserted_broadcasts(youtube_cls, items, expected_descriptions, absent_keywords, config, tomorrow) -> None:
+    # _FakeYoutube has no thumbnails API, so nothing it creates may be rolled back. The template rows
+    # use _NoThumbnailUploadYoutube: any upload attempt fails and the broadcast is deleted again, so
+    # they only check what was inserted.
+    youtube = youtube_cls(items)
+
+    assert run_scheduler(youtube, config) == 0
+    if youtube_cls is _FakeYoutube:
+        assert youtube._live.deleted_ids == []
+
+    inserted_titles = youtube._live.inserted_titles
+    for keyword, description in expected_descriptions.items():
+        title = build_title(keyword, tomorrow)
+        assert title in inserted_titles
+        if description is not None:
+            assert youtube._live.desc_by_title[title] == description
+    for keyword in absent_keywords:
+        assert build_title(keyword, tomorrow) not in inserted_titles
+
+
+@pytest.fixture
+def studio_patch(monkeypatch):
+    monkeypatch.setattr(scheduler_studio, "StudioBroadcastCreator", _FakeStudioCreator)
+
+
+def test_studio_mode_skips_api_insert_and_uses_ui_creator(studio_patch, make_config) -> None:
+    template_item = _make_item(
+        "template-10",
+        "Misa 10h histórica",
+        _iso_midnight(0),
+        description="Descripción emitida",
+        ended=True,
+        bound_stream="stream-shared",
+    )
+
+    youtube = _FakeYoutube([template_item])
+    config = make_config(creation_mode="studio_ui", studio_storage_state_path="fake.json")
+
+    run_scheduler(youtube, config)
+
+    assert len(youtube._live.inserted_bodies) == 0
+
+
+def test_copies_category_audience_and_chat_settings_from_latest_emitted(tomorrow, make_config) -> None:
+    template_item = {
+        "id": "latest-emitted-10",
+        "snippet": {
+            "title": "Misa 10h última",
+            "description": "Desc última 10",
+            "categoryId": "29",
+            "scheduledStartTime": _iso_midnight(-1),
+            "actualEndTime": _iso_midnight(-1),
+        },
+        "contentDetails": {
+            "enableLowLatency": True,
+            "enableDvr": False,
+            "enableLiveChat": True,
+            "enableLiveChatReplay": True,
+            "enableLiveChatSummary": True,
+            "boundStreamId": "stream-emitted",
+        },
+        "status": {
+            "privacyStatus": "unlisted",
+            "selfDeclaredMadeForKids": False,
+        },
+        "monetizationDetails": {
+            "adsMonetizationStatus": "off",
+            "cuepointSchedule": {"enabled": True},
+        },
+    }
+
+    youtube = _NoThumbnailUploadYoutube([template_item])
+    config = make_config(default_privacy_status="private")
+
+    run_scheduler(youtube, config)
+
+    misa_10_body = youtube._live.body_by_title[build_title("Misa 10h", tomorrow)]
+    assert misa_10_body["snippet"]["categoryId"] == "29"
+    assert misa_10_body["status"]["selfDeclaredMadeForKids"] is False
+    assert misa_10_body["contentDetails"]["enableLowLatency"] is True
+    assert misa_10_body["contentDetails"]["enableDvr"] is False
+    assert misa_10_body["monetizationDetails"]["adsMonetizationStatus"] == "on"
+    assert misa_10_body["monetizationDetails"]["cuepointSchedule"]["enabled"] is False
+    assert misa_10_body["contentDetails"]["enableLiveChat"] is False
+    assert misa_10_body["contentDetails"]["enableLiveChatReplay"] is True
+    assert misa_10_body["contentDetails"]["enableLiveChatSummary"] is True
+
+
+def test_rate_limit_exits_zero_after_retries(config) -> None:
+    youtube = _AlwaysRateLimitYoutube([])
+
+    assert run_scheduler(youtube, config) == 0
+
+
+def test_uploads_thumbnail_for_each_created_broadcast(make_config) -> None:
+    template_items = [
+        _make_template(f"Misa {hour}h", _iso_midnight(0), thumbnail_url=f"https://example.org/{hour}.jpg")
+        for hour in ("10", "12", "20")
+    ]
+
+    youtube = _ThumbnailUploadYoutube(template_items)
+    config = make_config(max_days_ahead=2)
+
+    with patch("src.scheduler.urlopen", return_value=_FakeThumbnailResponse()):
+        run_scheduler(youtube, config)
 
-        youtube = _NoThumbnailUploadYoutube([old_emitted_10, latest_emitted_10, latest_emitted_12])
-        config = Config(
-            client_id="id",
-            client_secret="secret",
-            refresh_token="token",
-            timezone="UTC",
-            default_privacy_status="unlisted",
-            keyword_misa_10="Misa 10h",
-            keyword_misa_12="Misa 12h",
-            keyword_misa_20="Misa 20h",
-            keyword_vela_21="Vela 21h",
-            start_offset_days=1,
-            max_days_ahead=1,
-            stop_on_create_limit=True,
-            rate_limit_retry_limit=1,
-            rate_limit_retry_base_seconds=0.0,
-            rate_limit_retry_max_seconds=0.0,
-            create_pause_seconds=0.0,
-        )
+    assert len(youtube._thumbs.calls) >= 6
 
-        run_scheduler(youtube, config)
 
-        tomorrow = today + timedelta(days=1)
-        misa_10_title = build_title("Misa 10h", tomorrow)
-        misa_12_title = build_title("Misa 12h", tomorrow)
-        description_by_title = {
-            body["snippet"]["title"]: body["snippet"]["description"]
-            for body in youtube._live.inserted_bodies
-            if "scheduledStartTime" in body["snippet"]
-        }
-        self.assertEqual(description_by_title[misa_10_title], "Desc última 10")
-        self.assertEqual(description_by_title[misa_12_title], "Desc última 12")
-
-    def test_copies_category_audience_and_chat_settings_from_latest_emitted(self) -> None:
-        tz = ZoneInfo("UTC")
-        today = datetime.now(tz).date()
-        template_item = {
-            "id": "latest-emitted-10",
-            "snippet": {
-                "title": "Misa 10h última",
-                "description": "Desc última 10",
-                "categoryId": "29",
-                "scheduledStartTime": datetime.combine(today - timedelta(days=1), datetime.min.time(), tz).isoformat(),
-                "actualEndTime": datetime.combine(today - timedelta(days=1), datetime.min.time(), tz).isoformat(),
-            },
-            "contentDetails": {
-                "enableLowLatency": True,
-                "enableDvr": False,
-                "enableLiveChat": True,
-                "enableLiveChatReplay": True,
-                "enableLiveChatSummary": True,
-                "boundStreamId": "stream-emitted",
-            },
-            "status": {
-                "privacyStatus": "unlisted",
-                "selfDeclaredMadeForKids": False,
-            },
-            "monetizationDetails": {
-                "adsMonetizationStatus": "off",
-                "cuepointSchedule": {"enabled": True},
-            },
-        }
+def test_downloads_each_template_thumbnail_once(make_config) -> None:
+    template_item = _make_item(
+        "template-misa",
+        "Misa 10h Misa 12h Misa 20h plantilla",
+        _iso_midnight(0),
+        description="Desc",
+        thumbnail_url="https://example.org/misa.jpg",
+    )
 
-        youtube = _NoThumbnailUploadYoutube([template_item])
-        config = Config(
-            client_id="id",
-            client_secret="secret",
-            refresh_token="token",
-            timezone="UTC",
-            default_privacy_status="private",
-            keyword_misa_10="Misa 10h",
-            keyword_misa_12="Misa 12h",
-            keyword_misa_20="Misa 20h",
-            keyword_vela_21="Vela 21h",
-            start_offset_days=1,
-            max_days_ahead=1,
-            stop_on_create_limit=True,
-            rate_limit_retry_limit=1,
-            rate_limit_retry_base_seconds=0.0,
-            rate_limit_retry_max_seconds=0.0,
-            create_pause_seconds=0.0,
-        )
+    youtube = _ThumbnailUploadYoutube([template_item])
+    config = make_config(max_days_ahead=2)
 
+    with patch("src.scheduler.urlopen", return_value=_FakeThumbnailResponse()) as urlopen_mock:
         run_scheduler(youtube, config)
 
-        tomorrow = today + timedelta(days=1)
-        misa_10_title = build_title("Misa 10h", tomorrow)
-        body_by_title = {
-            body["snippet"]["title"]: body
-            for body in youtube._live.inserted_bodies
-            if "scheduledStartTime" in body["snippet"]
-        }
-        misa_10_body = body_by_title[misa_10_title]
-        self.assertEqual(misa_10_body["snippet"]["categoryId"], "29")
-        self.assertFalse(misa_10_body["status"]["selfDeclaredMadeForKids"])
-        self.assertTrue(misa_10_body["contentDetails"]["enableLowLatency"])
-        self.assertFalse(misa_10_body["contentDetails"]["enableDvr"])
-        self.assertEqual(misa_10_body["monetizationDetails"]["adsMonetizationStatus"], "on")
-        self.assertFalse(misa_10_body["monetizationDetails"]["cuepointSchedule"]["enabled"])
-        self.assertFalse(misa_10_body["contentDetails"]["enableLiveChat"])
-        self.assertTrue(misa_10_body["contentDetails"]["enableLiveChatReplay"])
-        self.assertTrue(misa_10_body["contentDetails"]["enableLiveChatSummary"])
-
-    def test_skips_creation_when_same_slot_exists_even_with_different_title(self) -> None:
-        tz = ZoneInfo("UTC")
-        today = datetime.now(tz).date()
-        tomorrow = today + timedelta(days=1)
-        existing_slot = {
-            "id": "existing-misa-12",
-            "snippet": {
-                "title": "Misa 12h - Evento ya creado manualmente",
-                "description": "Desc previa",
-                "scheduledStartTime": datetime.combine(tomorrow, datetime.min.time().replace(hour=12), tz).isoformat(),
-            },
-            "contentDetails": {},
-            "status": {"privacyStatus": "unlisted"},
-        }
+    assert len(youtube._thumbs.calls) >= 6
+    assert urlopen_mock.call_count == 1
 
-        youtube = _FakeYoutube([existing_slot])
-        config = Config(
-            client_id="id",
-            client_secret="secret",
-            refresh_token="token",
-            timezone="UTC",
-            default_privacy_status="unlisted",
-            keyword_misa_10="Misa 10h",
-            keyword_misa_12="Misa 12h",
-            keyword_misa_20="Misa 20h",
-            keyword_vela_21="Vela 21h",
-            start_offset_days=1,
-            max_days_ahead=1,
-            stop_on_create_limit=True,
-            rate_limit_retry_limit=1,
-            rate_limit_retry_base_seconds=0.0,
-            rate_limit_retry_max_seconds=0.0,
-            create_pause_seconds=0.0,
-        )
 
+def test_skips_thumbnail_download_when_nothing_is_created(config, tomorrow) -> None:
+    template_item = _make_item(
+        "template-all",
+        "Misa 10h Misa 12h Misa 20h Vela 21h plantilla",
+        _iso_midnight(0),
+        description="Desc",
+        thumbnail_url="https://example.org/misa.jpg",
+    )
+    existing_items = [
+        _make_item(f"existing-{keyword}", build_title(keyword, tomorrow), _iso_midnight(1))
+        for keyword in ("Misa 10h", "Misa 12h", "Misa 20h", "Vela 21h")
+    ]
+
+    youtube = _ThumbnailUploadYoutube([template_item, *existing_items])
+
+    with patch("src.scheduler.urlopen", return_value=_FakeThumbnailResponse()) as urlopen_mock:
         run_scheduler(youtube, config)
 
-        created_titles = [body["snippet"]["title"] for body in youtube._live.inserted_bodies]
-        self.assertNotIn(build_title("Misa 12h", tomorrow), created_titles)
-
-    def test_rate_limit_exits_zero_after_retries(self) -> None:
-        youtube = _AlwaysRateLimitYoutube([])
-        config = Config(
-            client_id="id",
-            client_secret="secret",
-            refresh_token="token",
-            timezone="UTC",
-            default_privacy_status="unlisted",
-            keyword_misa_10="Misa 10h",
-            keyword_misa_12="Misa 12h",
-            keyword_misa_20="Misa 20h",
-            keyword_vela_21="Vela 21h",
-            start_offset_days=1,
-            max_days_ahead=1,
-            stop_on_create_limit=True,
-            rate_limit_retry_limit=1,
-            rate_limit_retry_base_seconds=0.0,
-            rate_limit_retry_max_seconds=0.0,
-            create_pause_seconds=0.0,
-        )
+    assert not youtube._live.inserted_titles
+    urlopen_mock.assert_not_called()
 
-        exit_code = run_scheduler(youtube, config)
-
-        self.assertEqual(exit_code, 0)
-
-    def test_uploads_thumbnail_for_each_created_broadcast(self) -> None:
-        tz = ZoneInfo("UTC")
-        today = datetime.now(tz).date()
-        template_items = [
-            {
-                "id": "template-10",
-                "snippet": {
-                    "title": "Misa 10h plantilla",
-                    "description": "Desc 10",
-                    "scheduledStartTime": datetime.combine(today, datetime.min.time(), tz).isoformat(),
-                    "thumbnails": {"high": {"url": "https://example.org/10.jpg"}},
-                },
-                "contentDetails": {},
-                "status": {"privacyStatus": "unlisted"},
-            },
-            {
-                "id": "template-12",
-                "snippet": {
-                    "title": "Misa 12h plantilla",
-                    "description": "Desc 12",
-                    "scheduledStartTime": datetime.combine(today, datetime.min.time(), tz).isoformat(),
-                    "thumbnails": {"high": {"url": "https://example.org/12.jpg"}},
-                },
-                "contentDetails": {},
-                "status": {"privacyStatus": "unlisted"},
-            },
-            {
-                "id": "template-20",
-                "snippet": {
-                    "title": "Misa 20h plantilla",
-                    "description": "Desc 20",
-                    "scheduledStartTime": datetime.combine(today, datetime.min.time(), tz).isoformat(),
-                    "thumbnails": {"high": {"url": "https://example.org/20.jpg"}},
-                },
-                "contentDetails": {},
-                "status": {"privacyStatus": "unlisted"},
-            },
-        ]
 
-        youtube = _ThumbnailUploadYoutube(template_items)
-        config = Config(
-            client_id="id",
-            client_secret="secret",
-            refresh_token="token",
-            timezone="UTC",
-            default_privacy_status="unlisted",
-            keyword_misa_10="Misa 10h",
-            keyword_misa_12="Misa 12h",
-            keyword_misa_20="Misa 20h",
-            keyword_vela_21="Vela 21h",
-            start_offset_days=1,
-            max_days_ahead=2,
-            stop_on_create_limit=True,
-            rate_limit_retry_limit=1,
-            rate_limit_retry_base_seconds=0.0,
-            rate_limit_retry_max_seconds=0.0,
-            create_pause_seconds=0.0,
-        )
+def test_retries_thumbnail_download_when_prefetch_fails(make_config) -> None:
+    template_item = _make_item(
+        "template-all",
+        "Misa 10h Misa 12h Misa 20h Vela 21h plantilla",
+        _iso_midnight(0),
+        description="Desc",
+        thumbnail_url="https://example.org/misa.jpg",
+    )
 
-        class _FakeHeaders:
-            @staticmethod
-            def get_content_type():
-                return "image/jpeg"
-
-        class _FakeResponse:
-            headers = _FakeHeaders()
-
-            def __enter__(self):
-                return self
-
-            def __exit__(self, exc_type, exc, tb):
-                return False
-
-            @staticmethod
-            def read():
-                return b"img"
-
-        with patch("src.scheduler.urlopen", return_value=_FakeResponse()):
-            run_scheduler(youtube, config)
-
-        self.assertGreaterEqual(len(youtube._thumbs.calls), 6)
-
-    def test_uses_template_description_and_shared_stream_binding(self) -> None:
-        tz = ZoneInfo("UTC")
-        today = datetime.now(tz).date()
-        tomorrow = today + timedelta(days=1)
-        template_item = {
-            "id": "template-10",
-            "snippet": {
-                "title": "Misa 10h plantilla",
-                "description": "Descripción misa 10h",
-                "scheduledStartTime": datetime.combine(today, datetime.min.time(), tz).isoformat(),
-            },
-            "contentDetails": {"boundStreamId": "stream-shared"},
-            "status": {"privacyStatus": "unlisted"},
-        }
+    youtube = _ThumbnailUploadYoutube([template_item])
+    config = make_config(max_days_ahead=2)
+    # Only the first download (the prefetch) hits a transient network error.
+    responses = iter([RuntimeError("connection reset")])
 
-        youtube = _FakeYoutube([template_item])
-        config = Config(
-            client_id="id",
-            client_secret="secret",
-            refresh_token="token",
-            timezone="UTC",
-            default_privacy_status="unlisted",
-            keyword_misa_10="Misa 10h",
-            keyword_misa_12="Misa 12h",
-            keyword_misa_20="Misa 20h",
-            keyword_vela_21="Vela 21h",
-            start_offset_days=1,
-            max_days_ahead=1,
-            stop_on_create_limit=True,
-            rate_limit_retry_limit=1,
-            rate_limit_retry_base_seconds=0.0,
-            rate_limit_retry_max_seconds=0.0,
-            create_pause_seconds=0.0,
-        )
+    def _flaky_urlopen(_url):
+        outcome = next(responses, None)
+        if outcome is not None:
+            raise outcome
+        return _FakeThumbnailResponse()
 
+    with patch("src.scheduler.urlopen", side_effect=_flaky_urlopen) as urlopen_mock:
         run_scheduler(youtube, config)
 
-        created_bodies = youtube._live.inserted_bodies
-        scheduled_bodies = [
-            body for body in created_bodies if body["snippet"]["title"] not in {"Misa 12h", "Misa 20h", "Vela 21h"}
-        ]
-        misa_10_title = build_title("Misa 10h", tomorrow)
-        misa_12_title = build_title("Misa 12h", tomorrow)
-        misa_20_title = build_title("Misa 20h", tomorrow)
-
-        description_by_title = {body["snippet"]["title"]: body["snippet"]["description"] for body in scheduled_bodies}
-        self.assertEqual(description_by_title[misa_10_title], "Descripción misa 10h")
-        self.assertEqual(description_by_title[misa_12_title], DEFAULT_MISA_DESCRIPTION)
-        self.assertEqual(description_by_title[misa_20_title], DEFAULT_MISA_DESCRIPTION)
-
-        for _broadcast_id, stream_id in youtube._live.bound_streams:
-            self.assertEqual(stream_id, "stream-shared")
-
-        vela_title = build_title("Vela 21h", tomorrow)
-        if tomorrow.weekday() == 3:
-            self.assertEqual(description_by_title[vela_title], DEFAULT_VELA_DESCRIPTION)
-
-    def test_deletes_broadcast_if_thumbnail_cannot_be_replicated(self) -> None:
-        tz = ZoneInfo("UTC")
-        today = datetime.now(tz).date()
-        template_item = {
-            "id": "latest-emitted-10",
-            "snippet": {
-                "title": "Misa 10h última",
-                "description": "Desc última 10",
-                "scheduledStartTime": datetime.combine(today - timedelta(days=1), datetime.min.time(), tz).isoformat(),
-                "actualEndTime": datetime.combine(today - timedelta(days=1), datetime.min.time(), tz).isoformat(),
-                "thumbnails": {"high": {"url": "https://example.org/fail.jpg"}},
-            },
-            "contentDetails": {"boundStreamId": "stream-emitted"},
-            "status": {"privacyStatus": "unlisted"},
-        }
+    assert youtube._live.deleted_ids == []
+    assert len(youtube._thumbs.calls) >= 6
+    assert urlopen_mock.call_count > 1
 
-        youtube = _ThumbnailUploadYoutube([template_item])
-        config = Config(
-            client_id="id",
-            client_secret="secret",
-            refresh_token="token",
-            timezone="UTC",
-            default_privacy_status="unlisted",
-            keyword_misa_10="Misa 10h",
-            keyword_misa_12="Misa 12h",
-            keyword_misa_20="Misa 20h",
-            keyword_vela_21="Vela 21h",
-            start_offset_days=1,
-            max_days_ahead=1,
-            stop_on_create_limit=True,
-            rate_limit_retry_limit=1,
-            rate_limit_retry_base_seconds=0.0,
-            rate_limit_retry_max_seconds=0.0,
-            create_pause_seconds=0.0,
-        )
 
-        with patch("src.scheduler.urlopen", side_effect=RuntimeError("download failed")):
-            run_scheduler(youtube, config)
-
-        self.assertGreaterEqual(len(youtube._live.deleted_ids), 1)
-
-    def test_updates_created_broadcast_when_chat_is_still_enabled(self) -> None:
-        youtube = _FakeYoutube([])
-        youtube._live.force_insert_chat_enabled = True
-
-        config = Config(
-            client_id="id",
-            client_secret="secret",
-            refresh_token="token",
-            timezone="UTC",
-            default_privacy_status="unlisted",
-            keyword_misa_10="Misa 10h",
-            keyword_misa_12="Misa 12h",
-            keyword_misa_20="Misa 20h",
-            keyword_vela_21="Vela 21h",
-            start_offset_days=1,
-            max_days_ahead=1,
-            stop_on_create_limit=True,
-            rate_limit_retry_limit=1,
-            rate_limit_retry_base_seconds=0.0,
-            rate_limit_retry_max_seconds=0.0,
-            create_pause_seconds=0.0,
-        )
+def test_deletes_broadcast_if_thumbnail_cannot_be_replicated(config) -> None:
+    template_item = _make_item(
+        "latest-emitted-10",
+        "Misa 10h última",
+        _iso_midnight(-1),
+        description="Desc última 10",
+        ended=True,
+        bound_stream="stream-emitted",
+        thumbnail_url="https://example.org/fail.jpg",
+    )
+
+    youtube = _ThumbnailUploadYoutube([template_item])
 
+    with patch("src.scheduler.urlopen", side_effect=RuntimeError("download failed")):
         run_scheduler(youtube, config)
 
-        self.assertGreaterEqual(len(youtube._live.updated_bodies), 1)
-        for body in youtube._live.updated_bodies:
-            self.assertFalse(body["contentDetails"]["enableLiveChat"])
-            self.assertEqual(set(body["contentDetails"].keys()), {"enableLiveChat"})
-
-    def test_updates_created_broadcast_when_verification_detects_live_chat_enabled(self) -> None:
-        youtube = _FakeYoutube([])
-        youtube._live.force_list_chat_enabled = True
-
-        config = Config(
-            client_id="id",
-            client_secret="secret",
-            refresh_token="token",
-            timezone="UTC",
-            default_privacy_status="unlisted",
-            keyword_misa_10="Misa 10h",
-            keyword_misa_12="Misa 12h",
-            keyword_misa_20="Misa 20h",
-            keyword_vela_21="Vela 21h",
-            start_offset_days=1,
-            max_days_ahead=1,
-            stop_on_create_limit=True,
-            rate_limit_retry_limit=1,
-            rate_limit_retry_base_seconds=0.0,
-            rate_limit_retry_max_seconds=0.0,
-            create_pause_seconds=0.0,
-        )
+    assert len(youtube._live.deleted_ids) >= 1
+
+
+@pytest.fixture
+def fresh_youtube():
+    # Each case gets its own fake: run_scheduler records inserts and updates on it.
+    def _fresh_youtube(items=(), chat_mode=None):
+        return _FakeYoutube(list(items), chat_mode=chat_mode)
+
+    return _fresh_youtube
+
+
+@pytest.mark.parametrize(
+    "chat_mode",
+    [
+        pytest.param("insert", id="chat-still-enabled-after-insert"),
+        pytest.param("list", id="verification-detects-live-chat-enabled"),
+    ],
+)
+def test_updates_created_broadcast_to_disable_live_chat(chat_mode, fresh_youtube, config) -> None:
+    youtube = fresh_youtube(chat_mode=chat_mode)
+
+    run_scheduler(youtube, config)
+
+    assert len(youtube._live.updated_bodies) >= 1
+    for body in youtube._live.updated_bodies:
+        assert body["contentDetails"]["enableLiveChat"] is False
+        assert set(body["contentDetails"].keys()) == {"enableLiveChat"}
+
+
+@pytest.fixture(scope="module")
+def shared_stream_run(config):
+    # run_scheduler runs once for the whole module; the tests below only read its output.
+    template_item = _make_item(
+        "template-10",
+        "Misa 10h plantilla",
+        _iso_midnight(0),
+        description="Descripción misa 10h",
+        bound_stream="stream-shared",
+    )
+
+    youtube = _FakeYoutube([template_item])
+    run_scheduler(youtube, config)
+
+    return SimpleNamespace(description_by_title=youtube._live.desc_by_title, bound_streams=list(youtube._live.bound_streams))
+
+
+def test_uses_template_description_for_matching_keyword(shared_stream_run, tomorrow) -> None:
+    description_by_title = shared_stream_run.description_by_title
+    assert description_by_title[build_title("Misa 10h", tomorrow)] == "Descripción misa 10h"
+    assert description_by_title[build_title("Misa 12h", tomorrow)] == DEFAULT_MISA_DESCRIPTION
+    assert description_by_title[build_title("Misa 20h", tomorrow)] == DEFAULT_MISA_DESCRIPTION
 
-        run_scheduler(youtube, config)
 
-        self.assertGreaterEqual(len(youtube._live.updated_bodies), 1)
-        for body in youtube._live.updated_bodies:
-            self.assertFalse(body["contentDetails"]["enableLiveChat"])
+def test_binds_every_broadcast_to_template_stream(shared_stream_run) -> None:
+    assert len(shared_stream_run.bound_streams) >= 1
+    for _broadcast_id, stream_id in shared_stream_run.bound_streams:
+        assert stream_id == "stream-shared"
 
 
-if __name__ == "__main__":
-    unittest.main()
+def test_vela_uses_default_description_on_thursday(shared_stream_run, tomorrow) -> None:
+    assert shared_stream_run.description_by_title[build_title("Vela 21h", tomorrow)] == DEFAULT_VELA_DESCRIPTION
@@ -1,142 +1,332 @@
-import json
-import sys
-import tempfile
-import types
-import unittest
-from pathlib import Path
-from unittest.mock import patch
+import re
+from datetime import datetime
+from unittest.mock import Mock
 
+import pytest
+
+from src import studio_creator
 from src.studio_creator import StudioBroadcastCreator, StudioCreationError
 
 
-class _FakePage:
-    def set_default_timeout(self, timeout_ms):
-        self.timeout_ms = timeout_ms
+pytestmark = pytest.mark.playwright
+
+
+def _fake_sync_playwright():
+    # playwright -> chromium.launch() -> new_context() -> new_page(), fresh for every start().
+    playwright = Mock()
+    page = playwright.chromium.launch.return_value.new_context.return_value.new_page.return_value
+    page.screenshot.return_value = b"fake-png"
+    return Mock(**{"start.return_value": playwright})
+
+
+class _FakeTimeoutError(Exception):
+    pass
+
+
+class _WizardLocator:
+    __slots__ = ("_page", "_role", "_name")
+
+    def __init__(self, page, role, name):
+        self._page = page
+        self._role = role
+        self._name = name
+
+    @property
+    def first(self):
+        return self
+
+    def wait_for(self, **_kwargs):
+        if not self._page.visibility_tab_visible:
+            raise _FakeTimeoutError()
 
-    def screenshot(self, **kwargs):
-        path = kwargs.get("path")
-        if path:
-            Path(path).write_bytes(b"fake-png")
+    def click(self, **_kwargs):
+        if self._role == "tab" and not self._page.visibility_tab_visible:
+            raise _FakeTimeoutError()
+        self._page.clicks.append((self._role, self._name))
+        if self._role == "button":
+            self._page.visibility_tab_visible = True
 
 
-class _FakeContext:
-    def new_page(self):
-        return _FakePage()
+class _DomLocator:
+    # Matches are kept in DOM order, like Playwright's.
+    __slots__ = ("_page", "_matches")
 
-    def close(self):
-        return None
+    def __init__(self, page, matches):
+        self._page = page
+        self._matches = matches
 
+    def count(self):
+        return len(self._matches)
 
-class _FakeBrowser:
-    def new_context(self, **kwargs):
-        self.kwargs = kwargs
-        return _FakeContext()
+    @property
+    def first(self):
+        return _DomLocator(self._page, self._matches[:1])
 
-    def close(self):
-        return None
+    def click(self, **_kwargs):
+        self._page.clicked.append(self._matches[0])
 
 
-class _FakeChromium:
-    def launch(self, **kwargs):
-        self.kwargs = kwargs
-        return _FakeBrowser()
+class _DomPage:
+    # Flat (tag, text) elements in document order.
+    __slots__ = ("elements", "clicked")
 
+    def __init__(self, elements):
+        self.elements = elements
+        self.clicked = []
+
+    def locator(self, selector):
+        tag, _, has_text = selector.partition(':has-text("')
+        text = has_text.removesuffix('")')
+        return _DomLocator(self, [element for element in self.elements if element[0] == tag and text in element[1]])
+
+    def get_by_text(self, text, exact=False):
+        return _DomLocator(self, [element for element in self.elements if text in element[1]])
+
+
+class _WizardPage:
+    __slots__ = ("visibility_tab_visible", "clicks")
 
-class _FakePlaywright:
     def __init__(self):
-        self.chromium = _FakeChromium()
+        self.visibility_tab_visible = False
+        self.clicks = []
+
+    def get_by_role(self, role, name):
+        return _WizardLocator(self, role, name)
 
-    def stop(self):
-        return None
 
+@pytest.fixture(scope="session")
+def valid_storage_state_dir(tmp_path_factory):
+    # Read-only for every test: a directory holding a single JSON with a non-default name.
+    directory = tmp_path_factory.mktemp("storage")
+    (directory / "sesion.json").write_bytes(b'{"cookies": [], "origins": []}')
+    return directory
 
-class _FakeSyncPlaywrightFactory:
-    def start(self):
-        return _FakePlaywright()
 
+@pytest.fixture(scope="session")
+def valid_storage_state(valid_storage_state_dir):
+    return valid_storage_state_dir / "sesion.json"
 
-class StudioCreatorTests(unittest.TestCase):
-    def _fake_playwright_modules(self):
-        playwright_module = types.ModuleType("playwright")
-        sync_api_module = types.ModuleType("playwright.sync_api")
-        sync_api_module.Error = Exception
-        sync_api_module.sync_playwright = lambda: _FakeSyncPlaywrightFactory()
-        playwright_module.sync_api = sync_api_module
-        return {
-            "playwright": playwright_module,
-            "playwright.sync_api": sync_api_module,
+
+@pytest.fixture
+def make_creator():
+    def _make_creator(storage_state_path="storage_state.json", **overrides):
+        options = {
+            "headless": True,
+            "timeout_ms": 30000,
+            "slow_mo_ms": 0,
+            "log_screenshots": False,
+            "log_screenshots_dir": "studio_logs",
         }
+        options.update(overrides)
+        return StudioBroadcastCreator(storage_state_path=storage_state_path, **options)
+
+    return _make_creator
+
+
+@pytest.fixture
+def patch_playwright(monkeypatch):
+    monkeypatch.setattr(studio_creator, "_PW_AVAILABLE", True)
+    monkeypatch.setattr(studio_creator, "PlaywrightError", Exception)
+    monkeypatch.setattr(studio_creator, "sync_playwright", _fake_sync_playwright)
+
+
+_MSG_MISSING_PATH = re.compile(re.escape("Falta YT_STUDIO_STORAGE_STATE_PATH"))
+_MSG_SEVERAL_JSON = re.compile(re.escape("varios JSON (a.json, b.json)"))
+_MSG_INVALID_JSON = re.compile(re.escape("no contiene JSON válido"))
+_MSG_FIELD_NOT_FOUND = re.compile(re.escape("No se encontró el campo esperado"))
+_MSG_BUTTON_NOT_FOUND = re.compile(re.escape("No se encontró el botón esperado"))
+
+
+def _blank_storage_path(_tmp_path):
+    return "   "
+
+
+def _directory_with_several_json_files(tmp_path):
+    for name in ("a.json", "b.json"):
+        (tmp_path / name).write_text("{}", encoding="utf-8")
+    return str(tmp_path)
+
+
+def _invalid_json_file(tmp_path):
+    json_path = tmp_path / "storage_state.json"
+    json_path.write_text("{not valid json", encoding="utf-8")
+    return str(json_path)
+
+
+@pytest.mark.parametrize(
+    ("storage_factory", "expected"),
+    [
+        pytest.param(_blank_storage_path, _MSG_MISSING_PATH, id="empty-path"),
+        pytest.param(_directory_with_several_json_files, _MSG_SEVERAL_JSON, id="several-json"),
+        pytest.param(_invalid_json_file, _MSG_INVALID_JSON, id="invalid-json"),
+    ],
+)
+def test_storage_state_validation_fails_before_playwright(tmp_path, storage_factory, expected, make_creator):
+    creator = make_creator(storage_factory(tmp_path))
+    with pytest.raises(StudioCreationError, match=expected):
+        creator.__enter__()
+
+
+def test_directory_with_single_json_is_accepted(valid_storage_state_dir, patch_playwright, make_creator):
+    creator = make_creator(str(valid_storage_state_dir))
+    with creator:
+        assert creator._storage_state_path == valid_storage_state_dir / "sesion.json"
+        assert creator._browser.new_context.call_args.kwargs["storage_state"] == {"cookies": [], "origins": []}
+
+
+def test_screenshot_directory_is_created_when_enabled(tmp_path, valid_storage_state, patch_playwright, make_creator):
+    screenshots_dir = tmp_path / "capturas"
+
+    creator = make_creator(str(valid_storage_state), log_screenshots=True, log_screenshots_dir=str(screenshots_dir))
+
+    with creator:
+        assert screenshots_dir.is_dir()
+        screenshots = list(screenshots_dir.glob("*.jpg"))
+        assert len(screenshots) >= 1
+
+
+def test_full_page_screenshots_are_saved_as_png(tmp_path, valid_storage_state, patch_playwright, make_creator):
+    screenshots_dir = tmp_path / "capturas"
+
+    creator = make_creator(
+        str(valid_storage_state),
+        log_screenshots=True,
+        log_screenshots_dir=str(screenshots_dir),
+        screenshot_full_page=True,
+    )
+
+    with creator:
+        assert len(list(screenshots_dir.glob("*.png"))) == 1
+        assert len(list(screenshots_dir.glob("*.jpg"))) == 0
 
-    def test_empty_storage_path_fails_with_clear_error(self):
-        creator = StudioBroadcastCreator(
-            storage_state_path="   ",
-            headless=True,
-            timeout_ms=30000,
-            slow_mo_ms=0,
-            log_screenshots=False,
-            log_screenshots_dir="studio_logs",
+
+def test_identical_screenshots_are_written_once(tmp_path, valid_storage_state, patch_playwright, make_creator):
+    screenshots_dir = tmp_path / "capturas"
+
+    creator = make_creator(str(valid_storage_state), log_screenshots=True, log_screenshots_dir=str(screenshots_dir))
+
+    with creator:
+        creator._capture_state("sin-cambios")
+        screenshots = list(screenshots_dir.glob("*.jpg"))
+        assert len(screenshots) == 1
+
+
+def test_only_changed_screenshots_are_written(tmp_path, make_creator):
+    creator = make_creator(log_screenshots=True, log_screenshots_dir=str(tmp_path))
+    page = Mock()
+    page.screenshot.side_effect = [b"fake-png", b"fake-png", b"other-png"]
+    creator._page = page
+
+    creator._capture_state("primera")
+    creator._capture_state("sin-acciones")
+    creator._capture_state("con-cambios")
+
+    written = sorted(path.name.rsplit("-", 1)[-1] for path in tmp_path.iterdir())
+    assert written == ["cambios.jpg", "primera.jpg"]
+
+
+def test_disabled_screenshots_never_touch_the_page(make_creator):
+    creator = make_creator()
+    page = Mock()
+    creator._page = page
+
+    creator._capture_state("desactivado")
+
+    page.screenshot.assert_not_called()
+
+
+def _page_with_inputs(*present_labels):
+    # page.locator(selector) -> one Mock per selector; it matches when a present label is in the selector.
+    page = Mock()
+    inputs = {}
+
+    def _locator(selector):
+        locator = inputs.setdefault(selector, Mock())
+        locator.count.return_value = int(any(f'"{label}"' in selector for label in present_labels))
+        return locator
+
+    page.locator.side_effect = _locator
+    return page, inputs
+
+
+def test_visibility_datetime_fills_preferred_date_and_time_inputs(make_creator):
+    creator = make_creator()
+    # Both languages present: the Spanish inputs come first in priority order.
+    page, inputs = _page_with_inputs("Date", "Fecha", "Time", "Hora")
+    creator._page = page
+
+    creator._set_visibility_datetime(datetime(2024, 3, 9, 20, 30))
+
+    filled = {
+        selector: locator.first.fill.call_args.args[0]
+        for selector, locator in inputs.items()
+        if locator.first.fill.called
+    }
+    assert filled == {
+        'input[aria-label*="Fecha"]': "09/03/2024",
+        'input[aria-label*="Hora"]': "20:30",
+    }
+
+
+def test_visibility_datetime_fails_when_time_input_is_missing(make_creator):
+    creator = make_creator()
+    creator._page, _inputs = _page_with_inputs("Date")
+
+    with pytest.raises(StudioCreationError, match=_MSG_FIELD_NOT_FOUND):
+        creator._set_visibility_datetime(datetime(2024, 3, 9, 20, 30))
+
+
+_BROADCAST_ROW = ("ytcp-video-row", "Misa 10h - Lunes 9 de marzo")
+_TEMPLATE_CARD = ("ytcp-entity-card", "Misa 10h plantilla")
+
+
+@pytest.mark.parametrize(
+    ("elements", "expected_click"),
+    [
+        # The livestreaming list behind the dialog renders earlier in the DOM than the template card.
+        pytest.param([_BROADCAST_ROW, _TEMPLATE_CARD], _TEMPLATE_CARD, id="card-wins-over-earlier-text"),
+        pytest.param([_BROADCAST_ROW], _BROADCAST_ROW, id="falls-back-to-text"),
+    ],
+)
+def test_template_pick_prefers_card_over_text_match(elements, expected_click, make_creator):
+    creator = make_creator()
+    page = _DomPage(elements)
+    creator._page = page
+
+    creator._pick_latest_matching_template("Misa 10h")
+
+    assert page.clicked == [expected_click]
+
+
+def test_template_pick_fails_when_nothing_matches(make_creator):
+    creator = make_creator()
+    creator._page = _DomPage([("ytcp-entity-card", "Vela 21h plantilla")])
+
+    with pytest.raises(StudioCreationError, match=_MSG_FIELD_NOT_FOUND):
+        creator._pick_latest_matching_template("Misa 10h")
+
+
+def test_missing_schedule_button_raises_creation_error(monkeypatch, make_creator):
+    creator = make_creator()
+    page = Mock()
+    page.get_by_role.return_value.first.wait_for.side_effect = _FakeTimeoutError()
+    creator._page = page
+
+    monkeypatch.setattr(studio_creator, "PlaywrightTimeoutError", _FakeTimeoutError)
+    with pytest.raises(StudioCreationError, match=_MSG_BUTTON_NOT_FOUND):
+        creator.create_with_previous_settings(
+            title="Misa 10h - Lunes 9 de marzo",
+            scheduled_start=datetime(2026, 3, 9, 10, 0),
+            template_keyword="Misa 10h",
         )
-        with self.assertRaises(StudioCreationError) as error:
-            creator.__enter__()
-
-        self.assertIn("Falta YT_STUDIO_STORAGE_STATE_PATH", str(error.exception))
-
-    def test_directory_with_single_json_is_accepted(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            json_path = Path(temp_dir) / "sesion.json"
-            json_path.write_text(json.dumps({"cookies": [], "origins": []}), encoding="utf-8")
-
-            creator = StudioBroadcastCreator(
-                storage_state_path=temp_dir,
-                headless=True,
-                timeout_ms=30000,
-                slow_mo_ms=0,
-                log_screenshots=False,
-                log_screenshots_dir="studio_logs",
-            )
-            with patch.dict(sys.modules, self._fake_playwright_modules()):
-                with creator:
-                    self.assertEqual(creator._storage_state_path, json_path)
-
-    def test_invalid_json_file_fails_before_playwright(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            json_path = Path(temp_dir) / "storage_state.json"
-            json_path.write_text("{not valid json", encoding="utf-8")
-
-            creator = StudioBroadcastCreator(
-                storage_state_path=str(json_path),
-                headless=True,
-                timeout_ms=30000,
-                slow_mo_ms=0,
-                log_screenshots=False,
-                log_screenshots_dir="studio_logs",
-            )
-            with self.assertRaises(StudioCreationError) as error:
-                creator.__enter__()
-
-        self.assertIn("no contiene JSON válido", str(error.exception))
-
-    def test_screenshot_directory_is_created_when_enabled(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            json_path = Path(temp_dir) / "storage_state.json"
-            json_path.write_text(json.dumps({"cookies": [], "origins": []}), encoding="utf-8")
-            screenshots_dir = Path(temp_dir) / "capturas"
-
-            creator = StudioBroadcastCreator(
-                storage_state_path=str(json_path),
-                headless=True,
-                timeout_ms=30000,
-                slow_mo_ms=0,
-                log_screenshots=True,
-                log_screenshots_dir=str(screenshots_dir),
-            )
-
-            with patch.dict(sys.modules, self._fake_playwright_modules()):
-                with creator:
-                    self.assertTrue(screenshots_dir.is_dir())
-                    screenshots = list(screenshots_dir.glob("*.png"))
-                    self.assertGreaterEqual(len(screenshots), 1)
-
-
-if __name__ == "__main__":
-    unittest.main()
+
+
+def test_visibility_tab_is_reached_after_clicking_next(monkeypatch, make_creator):
+    creator = make_creator()
+    page = _WizardPage()
+    creator._page = page
+
+    monkeypatch.setattr(studio_creator, "PlaywrightTimeoutError", _FakeTimeoutError)
+    creator._go_to_visibility_tab()
+
+    assert [role for role, _name in page.clicks] == ["button", "tab"]
@@ -1,16 +1,21 @@
 from datetime import date
-import unittest
-
-from src.title_format import build_title
 
+import pytest
 
-class TitleFormatTests(unittest.TestCase):
-    def test_build_title_includes_weekday_and_month(self) -> None:
-        self.assertEqual(
-            build_title("Misa 12h", date(2026, 2, 14)),
-            "Misa 12h - Sábado 14 de febrero",
-        )
+from src.title_format import build_title
 
 
-if __name__ == "__main__":
-    unittest.main()
+@pytest.mark.parametrize(
+    ("keyword", "target_date", "expected"),
+    [
+        ("Misa 10h", date(2026, 3, 9), "Misa 10h - Lunes 9 de marzo"),
+        ("Misa 12h", date(2026, 4, 14), "Misa 12h - Martes 14 de abril"),
+        ("Misa 20h", date(2024, 1, 3), "Misa 20h - Miércoles 3 de enero"),
+        ("Vela 21h", date(2026, 7, 30), "Vela 21h - Jueves 30 de julio"),
+        ("Misa 20h", date(2026, 12, 25), "Misa 20h - Viernes 25 de diciembre"),
+        ("Misa 12h", date(2026, 2, 14), "Misa 12h - Sábado 14 de febrero"),
+        ("Misa 10h", date(2026, 1, 4), "Misa 10h - Domingo 4 de enero"),
+    ],
+)
+def test_build_title_includes_weekday_and_month(keyword, target_date, expected) -> None:
+    assert build_title(keyword, target_date) == expected
@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from src import youtube_client
+from src.config import Config
+
+
+_CONFIG = Config(
+    client_id="id",
+    client_secret="secret",
+    refresh_token="token",
+    timezone="UTC",
+    default_privacy_status="unlisted",
+    keyword_misa_10="Misa 10h",
+    keyword_misa_12="Misa 12h",
+    keyword_misa_20="Misa 20h",
+    keyword_vela_21="Vela 21h",
+    start_offset_days=1,
+    max_days_ahead=1,
+    stop_on_create_limit=True,
+    rate_limit_retry_limit=1,
+    rate_limit_retry_base_seconds=0.0,
+    rate_limit_retry_max_seconds=0.0,
+    create_pause_seconds=0.0,
+)
+
+
+def _fake_refresh(credentials, _request):
+    credentials.token = "access-token"
+    credentials.expiry = datetime.utcnow() + timedelta(hours=1)
+
+
+def test_reuses_persisted_token_without_refreshing(tmp_path) -> None:
+    cache_path = tmp_path / "token.json"
+    with patch.object(youtube_client, "TOKEN_CACHE_PATH", cache_path), patch.object(
+        youtube_client.Credentials, "refresh", autospec=True, side_effect=_fake_refresh
+    ) as refresh_mock, patch.object(youtube_client, "build", return_value="client"):
+        youtube_client.build_youtube_client(_CONFIG)
+        youtube_client.build_youtube_client(_CONFIG)
+
+    assert cache_path.is_file()
+    assert refresh_mock.call_count == 1
+
+
+def test_refreshes_when_persisted_token_is_expired(tmp_path) -> None:
+    cache_path = tmp_path / "token.json"
+    with patch.object(youtube_client, "TOKEN_CACHE_PATH", cache_path), patch.object(
+        youtube_client.Credentials, "refresh", autospec=True, side_effect=_fake_refresh
+    ) as refresh_mock, patch.object(youtube_client, "build", return_value="client"):
+        youtube_client.build_youtube_client(_CONFIG)
+        with patch.object(
+            youtube_client,
+            "_load_cached_token",
+            return_value=("old-token", datetime.utcnow() - timedelta(minutes=1)),
+        ):
+            youtube_client.build_youtube_client(_CONFIG)
+
+    assert refresh_mock.call_count == 2